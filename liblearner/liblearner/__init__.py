@@ -3,6 +3,7 @@ LibLearner - A Python library for extracting and analyzing Python functions from
 """
 
 from .python_extractor import (
+    FunctionRecord,
     extract_functions,
     process_file,
     process_directory,
@@ -11,6 +12,7 @@ from .python_extractor import (
 
 __version__ = '0.1.0'
 __all__ = [
+    'FunctionRecord',
     'extract_functions',
     'process_file',
     'process_directory',
@@ -0,0 +1,55 @@
+"""
+On-disk cache of per-file processing results.
+
+Entries are keyed by a SHA-256 of the processor name, the file path, the
+source bytes and the Python version, so editing a file or switching
+interpreters always misses the cache. Writes go through a temporary file
+and os.replace, so readers never see a partial entry.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of cached results changes
+CACHE_VERSION = 4
+
+def cache_key(processor: str, file_path: str, source: bytes) -> str:
+    """Return the cache key for one file's source."""
+    digest = hashlib.sha256()
+    digest.update(f'{CACHE_VERSION}\0{sys.version}\0{processor}\0{file_path}\0'.encode('utf-8'))
+    digest.update(source)
+    return digest.hexdigest()
+
+def load(cache_dir: str, key: str) -> Optional[Any]:
+    """Return the cached value for key, or None on a miss or unreadable entry."""
+    try:
+        with open(os.path.join(cache_dir, key + '.pkl'), 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {key}: {e}")
+        return None
+
+def store(cache_dir: str, key: str, value: Any) -> None:
+    """Write value to the cache; failures are logged and otherwise ignored."""
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, os.path.join(cache_dir, key + '.pkl'))
+        tmp_path = None
+    except Exception as e:
+        logger.warning(f"Failed to write cache entry {key}: {e}")
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
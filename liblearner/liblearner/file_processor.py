@@ -5,8 +5,10 @@ Handles detection of file types and routing to appropriate processors.
 
 import os
 import mimetypes
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import magic  # python-magic library for robust file type detection
-from typing import Optional, Dict, Type, List, Union
+from typing import Optional, Dict, Type, List, Union, Tuple
 from abc import ABC, abstractmethod
 import sys
 import logging
@@ -19,9 +21,11 @@ from .processing_result import ProcessingResult
 # Default directories to ignore
 DEFAULT_IGNORE_DIRS = {"venv", ".git", "ds_venv", "dw_env", "__pycache__", ".venv", "*.egg-info", ".github", "node_modules", "*tests*"}
 
-# Set up root logger
+# Set up root logger. Processors log to its children and never configure
+# logging themselves; applications (or set_verbose) attach real handlers.
 logger = logging.getLogger('liblearner')
 logger.setLevel(logging.WARNING)
+logger.addHandler(logging.NullHandler())
 
 class FileProcessor(ABC):
     """Base class for file processors."""
@@ -62,6 +66,39 @@ class FileProcessor(ABC):
         """
         return self.results_df
 
+    def process_files(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[ProcessingResult]:
+        """
+        Process several files in a pool of worker processes.
+        
+        Each file is processed by a fresh processor of this class in a worker,
+        so parsing runs on every core instead of behind the GIL. The rows of
+        all files are added to results_df with a single concat.
+        
+        Args:
+            file_paths: Paths to the files to process
+            max_workers: Number of worker processes (default: one per CPU)
+            
+        Returns:
+            One ProcessingResult per file, in the order of file_paths
+        """
+        worker = partial(_process_in_worker, type(self), getattr(self, 'debug', False))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outputs = list(executor.map(worker, file_paths, chunksize=32))
+        
+        frames = [df for _, df in outputs if not df.empty]
+        if frames:
+            if not self.results_df.empty:
+                frames.insert(0, self.results_df)
+            self.results_df = pd.concat(frames, ignore_index=True)
+        return [result for result, _ in outputs]
+
+def _process_in_worker(processor_class: Type[FileProcessor], debug: bool,
+                       file_path: str) -> Tuple[ProcessingResult, pd.DataFrame]:
+    """Process one file in a worker process, returning its result and rows."""
+    processor = processor_class(debug=debug)
+    result = processor.process_file(file_path)
+    return result, processor.get_results_dataframe()
+
 class FileTypeDetector:
     """Handles file type detection using multiple methods."""
     
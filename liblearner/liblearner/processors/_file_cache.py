@@ -0,0 +1,46 @@
+"""
+In-memory cache of per-file processing results.
+
+Processors keep the result and rows of recently processed files, keyed by
+path and stored with the (mtime_ns, size) they were processed at, so an
+unchanged file is not processed again. Only a bounded number of files is
+kept, the least recently used being evicted first, and every hit returns
+a deep copy of the result so callers can't alter what later hits see.
+"""
+
+import copy
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# Files kept per processor unless a processor asks for another size
+DEFAULT_SIZE = 256
+
+class FileCache:
+    """Least recently used cache of (result, rows) per file path."""
+
+    def __init__(self, maxsize: int = DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, file_path: str, key: Tuple[int, int]) -> Optional[Tuple[Any, Any]]:
+        """
+        Return (result, rows) stored for file_path at key, or None on a miss.
+
+        The result is a copy the caller may change. The rows are the stored
+        ones and must only be read, e.g. to extend a row buffer with.
+        """
+        entry = self._entries.get(file_path)
+        if entry is None or entry[0] != key:
+            return None
+        self._entries.move_to_end(file_path)
+        return copy.deepcopy(entry[1]), entry[2]
+
+    def put(self, file_path: str, key: Tuple[int, int], result: Any, rows: Any) -> None:
+        """Store a copy of result and the rows for file_path as processed at key."""
+        self._entries[file_path] = (key, copy.deepcopy(result), rows)
+        self._entries.move_to_end(file_path)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -8,31 +8,241 @@ This processor extracts structured information from Markdown and MDX files, incl
 - Links and references
 - Blockquotes
 - Tables
-- Emphasis and strong text
 - JSX/TSX components (for MDX)
 - Frontmatter metadata
 """
 
 import re
+import sys
 import logging
 import pandas as pd
 from typing import Dict, List, Optional, Tuple, Union, Set
 from pathlib import Path
-import yaml
 import frontmatter
 import os
 import json
+import dataclasses
 
 from ..file_processor import FileProcessor
 from ..processing_result import MarkdownProcessingResult
+from ._file_cache import FileCache
+
+try:
+    import hyperscan  # Optional SIMD multi-pattern matcher
+except ImportError:
+    hyperscan = None
 
 # Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regex patterns for markdown parsing, compiled once at import time
+_PATTERNS = {
+    'header': re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE),
+    'code_block': re.compile(r'```(\w*)\n(.*?)\n```', re.DOTALL),
+    'jsx_component': re.compile(r'<([A-Z][a-zA-Z]*)[^>]*>.*?</\1>', re.DOTALL),
+    'inline_jsx': re.compile(r'<([A-Z][a-zA-Z]*)[^>]*/>', re.MULTILINE),
+    'list_item': re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE),
+    'ordered_list': re.compile(r'^\s*\d+\.\s+(.+)$', re.MULTILINE),
+    'link': re.compile(r'\[([^\]]+)\]\(([^)"]+)(?:\s+"[^"]*")?\)'),
+    'reference_link': re.compile(r'\[([^\]]+)\]\[([^\]]+)\]'),
+    'reference_def': re.compile(r'^\[([^\]]+)\]:\s*(.+)$', re.MULTILINE),
+    'direct_link': re.compile(r'<(https?://[^>]+)>', re.MULTILINE),
+    'blockquote': re.compile(r'^\s*>\s+(.+)$', re.MULTILINE),
+    'table': re.compile(r'^\|(.+)\|$\n\|[-:\s|]+\|\n((?:\|.+\|\n?)+)', re.MULTILINE),
+    'emphasis': re.compile(r'\*([^*]+)\*|_([^_]+)_'),
+    'strong': re.compile(r'\*\*([^*]+)\*\*|__([^_]+)__')
+}
+
+# The 'link', 'reference_link' and 'direct_link' patterns combined, so one
+# scan finds every inline link; the alternative that matched is lastgroup
+_INLINE_LINK_RE = re.compile(
+    r'(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)"]+)(?:\s+"[^"]*")?\))'
+    r'|(?P<reference>\[(?P<ref_text>[^\]]+)\]\[(?P<ref_id>[^\]]+)\])'
+    r'|(?P<direct><(?P<direct_url>https?://[^>]+)>)'
+)
+
+# Patterns used for validation and MDX imports
+_UNCLOSED_CODE_RE = re.compile(r'```[^\n]*\n(?:(?!```).)*(?:```)?', re.DOTALL)
+_BRACKET_TEXT_RE = re.compile(r'\[([^\[\]]*)\](?!\()')
+_IMPORT_LINE_RE = re.compile(r'^import\s+.*$', re.MULTILINE)
+
+# Output columns
+_COLUMNS = ('filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type')
+
+# Line-oriented block scanning. Block elements are recognised from the first
+# significant character of each line in a single pass, and lines inside
+# fenced code blocks are never treated as markdown. Only the inline
+# elements (links, JSX, MDX imports) still go through regexes.
+_BLOCK_KINDS = frozenset(('headers', 'code_blocks', 'lists', 'blockquotes', 'tables'))
+_LIST_MARKERS = frozenset('-*+')
+_TABLE_SEPARATOR_CHARS = frozenset('-:| \t')
+
+def _marker_text(line: str, start: int) -> Optional[str]:
+    """Return the text after a block marker ending at start, or None if there is none."""
+    rest = line[start:]
+    if not rest[:1].isspace():
+        return None
+    return rest.lstrip() or None
+
+def _is_table_row(line: str) -> bool:
+    """Check for a pipe-delimited table row."""
+    return len(line) > 2 and line[0] == '|' and line[-1] == '|'
+
+def _scan_blocks(content: str) -> Dict[str, List]:
+    """Collect headers, code blocks, list items, blockquotes and tables in one pass."""
+    blocks = {
+        'headers': [],
+        'code_blocks': [],
+        'list_items': [],
+        'ordered_items': [],
+        'blockquotes': [],
+        'tables': []
+    }
+    lines = content.split('\n')
+    line_count = len(lines)
+    fence_lang = None
+    fence_start = 0
+    i = 0
+    
+    while i < line_count:
+        line = lines[i]
+        i += 1
+        
+        # Inside a fence only the closing fence matters; like the opening
+        # one it may be indented, as in a list item
+        if fence_lang is not None:
+            if line.lstrip().startswith('```'):
+                blocks['code_blocks'].append((fence_lang, '\n'.join(lines[fence_start:i - 1])))
+                fence_lang = None
+            continue
+        
+        stripped = line.lstrip()
+        first = stripped[:1]
+        
+        if first == '`':
+            lang = stripped[3:]
+            if stripped.startswith('```') and (not lang or lang.replace('_', 'a').isalnum()):
+                fence_lang = lang
+                fence_start = i
+        elif first == '#':
+            level = len(line) - len(line.lstrip('#'))
+            if 1 <= level <= 6:
+                text = _marker_text(line, level)
+                if text:
+                    blocks['headers'].append((level, text))
+        elif first in _LIST_MARKERS:
+            text = _marker_text(stripped, 1)
+            if text:
+                blocks['list_items'].append(text)
+        elif first == '>':
+            text = _marker_text(stripped, 1)
+            if text:
+                blocks['blockquotes'].append(text)
+        elif first.isdecimal():
+            digits = len(stripped) - len(stripped.lstrip('0123456789'))
+            if digits and stripped[digits:digits + 1] == '.':
+                text = _marker_text(stripped, digits + 1)
+                if text:
+                    blocks['ordered_items'].append(text)
+        elif first == '|':
+            # Header row, separator row, then at least one body row
+            if (_is_table_row(line) and i + 1 < line_count
+                    and _is_table_row(lines[i])
+                    and _TABLE_SEPARATOR_CHARS.issuperset(lines[i])
+                    and _is_table_row(lines[i + 1])):
+                blocks['tables'].append(line[1:-1])
+                i += 2
+                while i < line_count and _is_table_row(lines[i]):
+                    i += 1
+    
+    return blocks
+
+# Shared props strings for the rows that carry no per-match data
+_EMPTY_PROPS = '{}'
+_HEADER_PROPS = tuple(f'{{"level": {level}}}' for level in range(7))
+_UNORDERED_PROPS = '{"ordered": false}'
+_ORDERED_PROPS = '{"ordered": true}'
+
+def _new_columns() -> Dict[str, List]:
+    """Return empty column lists that extractors append rows to."""
+    return {column: [] for column in _COLUMNS}
+
+def _build_dataframe(columns: Dict[str, List]) -> pd.DataFrame:
+    """Build the results DataFrame from column lists without a per-row pass."""
+    return pd.DataFrame(columns, columns=list(_COLUMNS), copy=False)
+
+# Cheap prefilters for each extractor, scanned in a single Hyperscan pass.
+# Each one is a superset of what the matching extractor's regexes accept,
+# so skipping an extractor whose prefilter never fired loses nothing.
+# Non-ASCII bytes are accepted wherever Python's unicode-aware \s or \d is.
+_WS = rb'[\s\x80-\xff]'
+_DIGIT = rb'[\d\x80-\xff]'
+_PREFILTERS = (
+    ('imports', rb'^import' + _WS),
+    ('headers', rb'#' + _WS),
+    ('code_blocks', rb'```'),
+    ('jsx_components', rb'<[A-Z]'),
+    ('lists', rb'(?:[-*+]|' + _DIGIT + rb'\.)' + _WS),
+    ('links', rb'\[|<https?://'),
+    ('blockquotes', rb'>' + _WS),
+    ('tables', rb'\|'),
+)
+_hs_database = None
+
+def _get_hs_database():
+    """Compile the prefilter database on first use, or return None without hyperscan."""
+    global _hs_database
+    if _hs_database is None and hyperscan is not None:
+        database = hyperscan.Database()
+        flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SINGLEMATCH
+        database.compile(
+            expressions=[expression for _, expression in _PREFILTERS],
+            ids=list(range(len(_PREFILTERS))),
+            flags=[flags] * len(_PREFILTERS)
+        )
+        _hs_database = database
+    return _hs_database
+
+# Without hyperscan, a coarser prefilter: the characters each extractor
+# needs somewhere in the file. One set() pass over the content is enough
+# to rule out every extractor on files with no markdown structure at all.
+_STRUCT_CHARS = (
+    ('headers', frozenset('#')),
+    ('code_blocks', frozenset('`')),
+    ('jsx_components', frozenset('<')),
+    ('lists', frozenset('-*+.')),
+    ('links', frozenset('[<')),
+    ('blockquotes', frozenset('>')),
+    ('tables', frozenset('|')),
+)
+
+def _scan_present_chars(content: str) -> Set[str]:
+    """Return the extractors whose structural characters occur in content."""
+    chars = set(content)
+    present = {name for name, needed in _STRUCT_CHARS if not chars.isdisjoint(needed)}
+    if 'import' in content:
+        present.add('imports')
+    return present
+
+def _scan_present(content: str) -> Set[str]:
+    """Return the extractors that may find something in content."""
+    database = _get_hs_database()
+    if database is None:
+        return _scan_present_chars(content)
+    present = set()
+    
+    def on_match(pattern_id, start, end, flags, context):
+        present.add(_PREFILTERS[pattern_id][0])
+    
+    database.scan(content.encode('utf-8'), match_event_handler=on_match)
+    return present
+
 class MarkdownProcessor(FileProcessor):
     """Processor for Markdown and MDX files."""
     
+    # Shared across instances; see _PATTERNS
+    patterns = _PATTERNS
+    
     def __init__(self, debug: bool = False):
         """Initialize the Markdown processor."""
         super().__init__()
@@ -40,7 +250,7 @@ class MarkdownProcessor(FileProcessor):
         if self.debug:
             logger.setLevel(logging.DEBUG)
             
-        # Initialize results DataFrame
+        # Initialize results DataFrame (this also clears the row buffer)
         self.results_df = pd.DataFrame()
             
         # Define supported MIME types
@@ -50,31 +260,33 @@ class MarkdownProcessor(FileProcessor):
             'text/mdx'
         }
             
-        # Initialize patterns
-        self._init_patterns()
-        
         # Initialize tracking variables
         self._order_counter = 0
         self._current_path = []
         
-    def _init_patterns(self):
-        """Initialize regex patterns for markdown parsing."""
-        self.patterns = {
-            'header': re.compile(r'^(#{1,6})\s+(.+)$', re.MULTILINE),
-            'code_block': re.compile(r'```(\w*)\n(.*?)\n```', re.DOTALL),
-            'jsx_component': re.compile(r'<([A-Z][a-zA-Z]*)[^>]*>.*?</\1>', re.DOTALL),
-            'inline_jsx': re.compile(r'<([A-Z][a-zA-Z]*)[^>]*/>', re.MULTILINE),
-            'list_item': re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE),
-            'ordered_list': re.compile(r'^\s*\d+\.\s+(.+)$', re.MULTILINE),
-            'link': re.compile(r'\[([^\]]+)\]\(([^)"]+)(?:\s+"[^"]*")?\)'),
-            'reference_link': re.compile(r'\[([^\]]+)\]\[([^\]]+)\]'),
-            'reference_def': re.compile(r'^\[([^\]]+)\]:\s*(.+)$', re.MULTILINE),
-            'direct_link': re.compile(r'<(https?://[^>]+)>', re.MULTILINE),
-            'blockquote': re.compile(r'^\s*>\s+(.+)$', re.MULTILINE),
-            'table': re.compile(r'^\|(.+)\|$\n\|[-:\s|]+\|\n((?:\|.+\|\n?)+)', re.MULTILINE),
-            'emphasis': re.compile(r'\*([^*]+)\*|_([^_]+)_'),
-            'strong': re.compile(r'\*\*([^*]+)\*\*|__([^_]+)__')
-        }
+        # Results and rows of recently processed files, reused while unchanged
+        self._cache = FileCache()
+        
+    @property
+    def results_df(self) -> pd.DataFrame:
+        """Combined results of every processed file."""
+        return self.flush()
+    
+    @results_df.setter
+    def results_df(self, df: pd.DataFrame) -> None:
+        self._results_df = df
+        self._row_buffer = _new_columns()
+        
+    def flush(self) -> pd.DataFrame:
+        """Add the rows buffered since the last flush to results_df in one batch."""
+        if self._row_buffer['order']:
+            df = _build_dataframe(self._row_buffer)
+            if not self._results_df.empty:
+                self._results_df = pd.concat([self._results_df, df], ignore_index=True)
+            else:
+                self._results_df = df
+            self._row_buffer = _new_columns()
+        return self._results_df
         
     def get_supported_types(self) -> List[str]:
         """Return list of supported MIME types."""
@@ -85,7 +297,7 @@ class MarkdownProcessor(FileProcessor):
         errors = []
         
         # Check for unclosed code blocks
-        code_blocks = re.findall(r'```[^\n]*\n(?:(?!```).)*(?:```)?', content, re.DOTALL)
+        code_blocks = _UNCLOSED_CODE_RE.findall(content)
         for block in code_blocks:
             if not block.strip().endswith('```'):
                 errors.append("Found unclosed code block")
@@ -93,7 +305,7 @@ class MarkdownProcessor(FileProcessor):
         
         # Check for unclosed links
         # Count opening and closing brackets to handle nested brackets
-        link_text = re.findall(r'\[([^\[\]]*)\](?!\()', content)
+        link_text = _BRACKET_TEXT_RE.findall(content)
         for text in link_text:
             if '[' in text or ']' in text:
                 errors.append(f"Found unclosed links: {text}")
@@ -121,18 +333,35 @@ class MarkdownProcessor(FileProcessor):
         """Process a markdown or MDX file and extract structured information."""
         self._order_counter = 0
         result = MarkdownProcessingResult()
-        results_data = []
+        results_data = _new_columns()
         
         path = Path(file_path)
+        # One shared string object for every row of this file
+        file_path = sys.intern(str(file_path))
         
         # Check file existence first
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             logger.error(f"Error processing {file_path}: File not found")
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        # Reuse the previous result while the file is unchanged
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(file_path, cache_key)
+        if cached is not None:
+            result, rows = cached
+            for column, values in rows.items():
+                self._row_buffer[column].extend(values)
+            result.df = _build_dataframe(rows)
+            return result
+        
         try:
-            # Read file content
-            content = path.read_text()
+            # Read file content with a single read and a single decode
+            content = path.read_bytes().decode('utf-8')
+            # Line endings are normalized as text mode would
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
             # Parse frontmatter
             try:
@@ -152,8 +381,8 @@ class MarkdownProcessor(FileProcessor):
             result.file_info = {
                 'name': path.name,
                 'path': str(path.absolute()),
-                'size': path.stat().st_size,
-                'last_modified': path.stat().st_mtime,
+                'size': stat.st_size,
+                'last_modified': stat.st_mtime,
                 'type': 'markdown'
             }
             
@@ -164,263 +393,160 @@ class MarkdownProcessor(FileProcessor):
                     result.errors.append(error)
                     logger.warning(f"Validation error in {file_path}: {error}")
             
-            # Process imports (MDX specific)
-            if str(path).endswith('.mdx'):
-                self._process_imports(content, results_data, file_path)
+            # Find which extractors can match at all; a file without any
+            # markdown structure skips every extractor
+            present = _scan_present(content)
+            blocks = None
+            if not present.isdisjoint(_BLOCK_KINDS):
+                blocks = _scan_blocks(content)
+            extractors = [
+                ('imports', self._process_imports, content),
+                ('headers', self._process_headers, blocks),
+                ('code_blocks', self._process_code_blocks, blocks),
+                ('jsx_components', self._process_jsx_components, content),
+                ('lists', self._process_lists, blocks),
+                ('links', self._process_links, content),
+                ('blockquotes', self._process_blockquotes, blocks),
+                ('tables', self._process_tables, blocks)
+            ]
             
-            # Process markdown elements
-            self._process_headers(content, results_data, file_path)
-            self._process_code_blocks(content, results_data, file_path)
-            self._process_jsx_components(content, results_data, file_path)
-            self._process_lists(content, results_data, file_path)
-            self._process_links(content, results_data, file_path)
-            self._process_blockquotes(content, results_data, file_path)
-            self._process_tables(content, results_data, file_path)
+            # Process imports (MDX specific) and markdown elements
+            for name, extractor, source in extractors:
+                if name == 'imports' and not str(path).endswith('.mdx'):
+                    continue
+                if name in present:
+                    extractor(source, results_data, file_path)
             
-            # Create DataFrame
-            df = pd.DataFrame(results_data) if results_data else pd.DataFrame(columns=[
-                'filepath', 'parent_path', 'order', 'name', 
-                'content', 'props', 'processor_type'
-            ])
+            # Buffer rows for the combined results; they are concatenated
+            # once on flush() instead of after every file
+            for column, values in results_data.items():
+                self._row_buffer[column].extend(values)
             
-            if not df.empty:
-                df = df.rename(columns={'type': 'processor_type'})
-                column_order = ['filepath', 'parent_path', 'order', 'name', 
-                              'content', 'props', 'processor_type']
-                df = df[column_order]
-                
-                # Concatenate with existing results
-                if not self.results_df.empty:
-                    self.results_df = pd.concat([self.results_df, df], ignore_index=True)
-                else:
-                    self.results_df = df
+            # Create DataFrame straight from the column lists
+            df = _build_dataframe(results_data)
             
             # Set the DataFrame in the result object
             result.df = df
+            # Only the rows are kept; the DataFrame is rebuilt on a hit
+            self._cache.put(file_path, cache_key, dataclasses.replace(result, df=None), results_data)
                     
         except Exception as e:
             result.errors.append(str(e))
             logger.error(f"Error processing {file_path}: {e}")
             
             # Initialize empty DataFrame for error cases
-            result.df = pd.DataFrame(columns=[
-                'filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type'
-            ])
+            result.df = _build_dataframe(_new_columns())
             
         return result
         
-    def _process_imports(self, content: str, results_data: List[Dict], file_path: str):
+    def _extend_rows(self, results_data: Dict[str, List], file_path: str, names: List[str],
+                     contents: List[str], props: List[str], processor_type: str) -> None:
+        """Append a batch of extracted elements of one type to the column lists."""
+        count = len(names)
+        if not count:
+            return
+        start = self._order_counter + 1
+        self._order_counter += count
+        results_data['filepath'].extend([file_path] * count)
+        results_data['parent_path'].extend(['.'.join(self._current_path)] * count)
+        results_data['order'].extend(range(start, start + count))
+        results_data['name'].extend(names)
+        results_data['content'].extend(contents)
+        results_data['props'].extend(props)
+        results_data['processor_type'].extend([processor_type] * count)
+        
+    def _process_imports(self, content: str, results_data: Dict[str, List], file_path: str):
         """Process MDX import statements."""
-        import_lines = re.finditer(r'^import\s+.*$', content, re.MULTILINE)
-        for match in import_lines:
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '',
-                'order': self._order_counter,
-                'name': 'import',
-                'content': match.group(0),
-                'props': '{}',
-                'type': 'import'
-            })
+        imports = [match.group(0) for match in _IMPORT_LINE_RE.finditer(content)]
+        self._extend_rows(results_data, file_path, ['import'] * len(imports), imports,
+                          [_EMPTY_PROPS] * len(imports), 'import')
             
-    def _process_headers(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_headers(self, blocks: Dict[str, List], results_data: Dict[str, List], file_path: str):
         """Process markdown headers."""
-        for match in self.patterns['header'].finditer(content):
-            level = len(match.group(1))
-            text = match.group(2)
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': f'h{level}',
-                'content': text,
-                'props': f'{{"level": {level}}}',
-                'type': 'header'
-            })
+        headers = blocks['headers']
+        self._extend_rows(results_data, file_path,
+                          [f'h{level}' for level, _ in headers],
+                          [text for _, text in headers],
+                          [_HEADER_PROPS[level] for level, _ in headers], 'header')
             
-    def _process_code_blocks(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_code_blocks(self, blocks: Dict[str, List], results_data: Dict[str, List], file_path: str):
         """Process code blocks with language information."""
-        for match in self.patterns['code_block'].finditer(content):
-            lang = match.group(1) or 'text'
-            code = match.group(2)
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': 'code',
-                'content': code,
-                'props': f'{{"language": "{lang}"}}',
-                'type': 'code_block'
-            })
+        code_blocks = blocks['code_blocks']
+        self._extend_rows(results_data, file_path, ['code'] * len(code_blocks),
+                          [code for _, code in code_blocks],
+                          [f'{{"language": "{lang or "text"}"}}' for lang, _ in code_blocks],
+                          'code_block')
             
-    def _process_jsx_components(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_jsx_components(self, content: str, results_data: Dict[str, List], file_path: str):
         """Process JSX/TSX components in MDX files."""
-        # Process full components
-        for match in self.patterns['jsx_component'].finditer(content):
-            component_name = match.group(1)
-            component_content = match.group(0)
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': component_name,
-                'content': component_content,
-                'props': '{}',  # Could be enhanced to parse actual props
-                'type': 'jsx_component'
-            })
-            
-        # Process self-closing components
-        for match in self.patterns['inline_jsx'].finditer(content):
-            component_name = match.group(1)
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': component_name,
-                'content': match.group(0),
-                'props': '{}',
-                'type': 'jsx_component'
-            })
+        # Full components first, then self-closing ones
+        matches = list(self.patterns['jsx_component'].finditer(content))
+        matches.extend(self.patterns['inline_jsx'].finditer(content))
+        # Props could be enhanced to parse actual props
+        self._extend_rows(results_data, file_path,
+                          [match.group(1) for match in matches],
+                          [match.group(0) for match in matches],
+                          [_EMPTY_PROPS] * len(matches), 'jsx_component')
             
-    def _process_lists(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_lists(self, blocks: Dict[str, List], results_data: Dict[str, List], file_path: str):
         """Process markdown lists."""
-        # Process unordered lists
-        for match in self.patterns['list_item'].finditer(content):
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': 'list_item',
-                'content': match.group(1),
-                'props': '{"ordered": false}',
-                'type': 'list_item'
-            })
+        unordered = blocks['list_items']
+        ordered = blocks['ordered_items']
+        count = len(unordered) + len(ordered)
+        self._extend_rows(results_data, file_path, ['list_item'] * count, unordered + ordered,
+                          [_UNORDERED_PROPS] * len(unordered) + [_ORDERED_PROPS] * len(ordered),
+                          'list_item')
             
-        # Process ordered lists
-        for match in self.patterns['ordered_list'].finditer(content):
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': 'list_item',
-                'content': match.group(1),
-                'props': '{"ordered": true}',
-                'type': 'list_item'
-            })
-            
-    def _process_links(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_links(self, content: str, results_data: Dict[str, List], file_path: str):
         """Process links."""
-        # Process standard links
-        for match in self.patterns['link'].finditer(content):
-            self._order_counter += 1
-            text, url = match.groups()
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': text,
-                'content': url,
-                'props': json.dumps({"text": text}),
-                'type': 'link'
-            })
-            
-        # Process reference-style links
+        # Collect every inline link kind in one scan
+        links = []
+        reference_links = []
+        direct_links = []
+        for match in _INLINE_LINK_RE.finditer(content):
+            kind = match.lastgroup
+            if kind == 'link':
+                links.append((match.group('link_text'), match.group('link_url')))
+            elif kind == 'reference':
+                reference_links.append((match.group('ref_text'), match.group('ref_id')))
+            else:
+                direct_links.append(match.group('direct_url'))
+        
+        # Resolve reference-style links against their definitions
         references = {}
         for match in self.patterns['reference_def'].finditer(content):
             ref_id, url = match.groups()
             references[ref_id.lower()] = url.strip()
-            
-        for match in self.patterns['reference_link'].finditer(content):
-            text, ref_id = match.groups()
+        resolved = []
+        for text, ref_id in reference_links:
             url = references.get(ref_id.lower())
             if url:
-                self._order_counter += 1
-                results_data.append({
-                    'filepath': str(file_path),
-                    'parent_path': '.'.join(self._current_path),
-                    'order': self._order_counter,
-                    'name': text,
-                    'content': url,
-                    'props': json.dumps({"text": text, "reference": ref_id}),
-                    'type': 'link'
-                })
-                
-        # Process direct links
-        for match in self.patterns['direct_link'].finditer(content):
-            url = match.group(1)
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': url,
-                'content': url,
-                'props': json.dumps({"text": url, "direct": True}),
-                'type': 'link'
-            })
+                resolved.append((text, ref_id, url))
+        
+        # Standard, reference-style, then direct links
+        names = [text for text, _ in links]
+        names += [text for text, _, _ in resolved]
+        names += direct_links
+        urls = [url for _, url in links]
+        urls += [url for _, _, url in resolved]
+        urls += direct_links
+        props = [json.dumps({"text": text}) for text, _ in links]
+        props += [json.dumps({"text": text, "reference": ref_id}) for text, ref_id, _ in resolved]
+        props += [json.dumps({"text": url, "direct": True}) for url in direct_links]
+        self._extend_rows(results_data, file_path, names, urls, props, 'link')
             
-    def _process_blockquotes(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_blockquotes(self, blocks: Dict[str, List], results_data: Dict[str, List], file_path: str):
         """Process blockquotes."""
-        for idx, match in enumerate(self.patterns['blockquote'].finditer(content)):
-            self._order_counter += 1
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': f'quote_{idx}',
-                'content': match.group(1).strip(),
-                'props': '{}',
-                'type': 'blockquote'
-            })
+        quotes = blocks['blockquotes']
+        self._extend_rows(results_data, file_path,
+                          [f'quote_{idx}' for idx in range(len(quotes))],
+                          [text.strip() for text in quotes],
+                          [_EMPTY_PROPS] * len(quotes), 'blockquote')
             
-    def _process_tables(self, content: str, results_data: List[Dict], file_path: str):
+    def _process_tables(self, blocks: Dict[str, List], results_data: Dict[str, List], file_path: str):
         """Process tables."""
-        for idx, match in enumerate(self.patterns['table'].finditer(content)):
-            self._order_counter += 1
-            cells = [cell.strip() for cell in match.group(1).split('|')]
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': f'row_{idx}',
-                'content': '|'.join(cells),
-                'props': f'{{"cells": {cells}}}',
-                'type': 'table_row'
-            })
-            
-    def _process_emphasis(self, content: str, results_data: List[Dict], file_path: str):
-        """Process emphasized text."""
-        for idx, match in enumerate(self.patterns['emphasis'].finditer(content)):
-            self._order_counter += 1
-            text = match.group(1) or match.group(2)
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': f'em_{idx}',
-                'content': text,
-                'props': '{}',
-                'type': 'emphasis'
-            })
-            
-    def _process_strong(self, content: str, results_data: List[Dict], file_path: str):
-        """Process strong text."""
-        for idx, match in enumerate(self.patterns['strong'].finditer(content)):
-            self._order_counter += 1
-            text = match.group(1) or match.group(2)
-            results_data.append({
-                'filepath': str(file_path),
-                'parent_path': '.'.join(self._current_path),
-                'order': self._order_counter,
-                'name': f'strong_{idx}',
-                'content': text,
-                'props': '{}',
-                'type': 'strong'
-            })
+        rows = [[cell.strip() for cell in header.split('|')] for header in blocks['tables']]
+        self._extend_rows(results_data, file_path,
+                          [f'row_{idx}' for idx in range(len(rows))],
+                          ['|'.join(cells) for cells in rows],
+                          [f'{{"cells": {cells}}}' for cells in rows], 'table_row')
@@ -8,22 +8,74 @@ This processor extracts structured information from MDX files, including:
 - File metadata
 """
 
+import copy
 import os
 import re
-import yaml
 import logging
-from typing import Dict, List, Any, Optional
+from bisect import bisect_right
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
-import csv
 from datetime import date, datetime
 import pandas as pd
 
 from ..file_processor import FileProcessor
+from ._file_cache import FileCache
 
 # Set up a logger for debug output
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regex patterns for MDX parsing, compiled once at import time
+_FRONTMATTER_RE = re.compile(r'^---\s*(.*?)\s*---', re.DOTALL)
+_IMPORT_RE = re.compile(r'import\s+(?:\{\s*(?P<items>[^}]+)\s*\}|\s*(?P<default>\w+)(?:,\s*\w+)?)\s+from\s+[\'"](?P<source>[^\'"]+)[\'"]')
+_COMPONENT_OPEN_RE = re.compile(r'<(?P<name>[A-Z][a-zA-Z0-9]*)\s*(?P<props>[^>]*)>')
+# Prop names only start at a word boundary. Without the lookbehind a failed
+# match is retried from every character of the same word, which is quadratic
+# in the word's length; a name can only start mid-word at the start of a
+# scanned span, and those spans are rescanned on their own.
+_PROP_RE = re.compile(r'(?<!\w)(\w+)=(?:{([^}]+)}|"([^"]+)")')
+_MID_WORD_RE = re.compile(r'(?<=\w)\w')
+
+# Flat "key: value" frontmatter that can be parsed without YAML. Anything
+# that YAML might resolve to another type (bools, nulls, floats, quoted or
+# flow values, nesting, comments) falls back to the YAML safe loader.
+_FM_KEY_RE = re.compile(r'[A-Za-z_][\w-]*')
+_FM_PLAIN_RE = re.compile(r"[A-Za-z][\w .,/()'-]*")
+_FM_INT_RE = re.compile(r'[-+]?(?:0|[1-9][0-9]*)')
+_FM_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+_YAML_KEYWORDS = frozenset(('yes', 'no', 'true', 'false', 'on', 'off', 'null'))
+
+def _close_component(content: str, name: str, open_end: int) -> Tuple[Optional[str], int]:
+    """
+    Find the inner content of a component whose opening tag ends at open_end.
+    
+    The closing tag is found with str.find, so there is no lazy DOTALL scan
+    or backreference to backtrack over the file. Returns the inner content,
+    or None for a component without a closing tag, and the offset where the
+    search for the next component resumes.
+    """
+    closing_tag = f'</{name}>'
+    close = content.find(closing_tag, open_end)
+    if close == -1:
+        return None, open_end
+    return content[open_end:close], close + len(closing_tag)
+
+def _iter_components(content: str):
+    """Yield (name, props span, inner content) for each JSX component."""
+    pos = 0
+    while True:
+        match = _COMPONENT_OPEN_RE.search(content, pos)
+        if match is None:
+            return
+        name = match.group('name')
+        inner_content, pos = _close_component(content, name, match.end())
+        yield name, match.span('props'), inner_content
+
+def _iter_imports(content: str):
+    """Yield (items, source) for each import statement."""
+    # findall returns the (items, default, source) groups without match objects
+    for items, default, source in _IMPORT_RE.findall(content):
+        yield items or default, source
+
 class MDXProcessor(FileProcessor):
     """Process MDX files and extract structured information."""
     
@@ -33,11 +85,9 @@ class MDXProcessor(FileProcessor):
         self.debug = debug
         if self.debug:
             logger.setLevel(logging.DEBUG)
-        self.frontmatter_pattern = re.compile(r'^---\s*(.*?)\s*---', re.DOTALL)
-        self.import_pattern = re.compile(r'import\s+(?:\{\s*([^}]+)\s*\}|\s*(\w+)(?:,\s*(\w+))?)\s+from\s+[\'"]([^\'"]+)[\'"]')
-        self.export_pattern = re.compile(r'export\s+.*$', re.MULTILINE)
-        self.component_pattern = re.compile(r'<([A-Z][a-zA-Z0-9]*)\s*([^>]*)>(?:(.*?)<\/\1>|[^<]*)', re.DOTALL)
-        self.prop_pattern = re.compile(r'(\w+)=(?:{([^}]+)}|"([^"]+)")')
+
+        # Results and rows of recently processed files, reused while unchanged
+        self._cache = FileCache()
 
     def get_supported_types(self) -> List[str]:
         """Return list of supported MIME types."""
@@ -54,94 +104,161 @@ class MDXProcessor(FileProcessor):
             Dictionary containing extracted information
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Reuse the previous result while the file is unchanged
+            stat = os.stat(file_path)
+            cache_key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get(file_path, cache_key)
+            if cached is not None:
+                result, rows = cached
+                # Rows hold the component props dicts, so they are copied too
+                self.results_df = pd.DataFrame(copy.deepcopy(rows), copy=False)
+                return result
 
-            # Extract components
-            components = []
-            for match in self.component_pattern.finditer(content):
-                component_name = match.group(1)
-                props_str = match.group(2)
-                content = match.group(3)
-                props = self._extract_props(props_str) if props_str else {}
-                components.append({
-                    'name': component_name,
-                    'props': props,
-                    'content': content
-                })
+            # Single read of the known file size, then a single decode
+            content = Path(file_path).read_bytes().decode('utf-8')
+            # Line endings are normalized as text mode would
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
 
             # Extract imports
-            imports = []
-            for match in self.import_pattern.finditer(content):
-                imports.append({
-                    'items': match.group(1) or match.group(2),
-                    'source': match.group(4)
-                })
+            imports = [{'items': items, 'source': source} for items, source in _iter_imports(content)]
 
             # Extract frontmatter
             frontmatter = {}
-            fm_match = self.frontmatter_pattern.match(content)
+            fm_match = _FRONTMATTER_RE.match(content)
             if fm_match:
-                try:
-                    frontmatter = yaml.safe_load(fm_match.group(1))
-                except yaml.YAMLError as e:
-                    logger.error(f"Error parsing frontmatter in {file_path}: {str(e)}")
+                frontmatter = self._parse_flat_frontmatter(fm_match.group(1))
+                if frontmatter is None:
+                    # PyYAML is only imported for frontmatter the fast path can't handle
+                    import yaml
+                    # libyaml's C loader when PyYAML was built with it
+                    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                    try:
+                        frontmatter = yaml.load(fm_match.group(1), Loader=loader) or {}
+                    except yaml.YAMLError as e:
+                        frontmatter = {}
+                        logger.error(f"Error parsing frontmatter in {file_path}: {str(e)}")
 
-            # Create results DataFrame
-            results_data = []
-            
-            # Add components to DataFrame
-            for comp in components:
-                results_data.append({
-                    'type': 'component',
-                    'name': comp['name'],
-                    'content': comp.get('content', ''),
-                    'props': str(comp.get('props', {})),
-                    'file_path': file_path
-                })
-            
-            # Add imports to DataFrame
-            for imp in imports:
-                results_data.append({
-                    'type': 'import',
-                    'name': imp['items'],
-                    'content': imp['source'],
-                    'props': '',
-                    'file_path': file_path
+            # Extract components, then all of their props in one pass
+            component_matches = list(_iter_components(content))
+            all_props = self._extract_component_props(
+                content, [props_span for _, props_span, _ in component_matches])
+            components = []
+            for (name, _, inner_content), props in zip(component_matches, all_props):
+                components.append({
+                    'name': name,
+                    'props': props,
+                    'content': inner_content
                 })
+
+            # Create results DataFrame from per-column lists, one batch per row type
+            results_data = {'type': [], 'name': [], 'content': [], 'props': [], 'file_path': []}
+            self._extend_rows(results_data, 'component',
+                              [comp['name'] for comp in components],
+                              [comp.get('content', '') for comp in components],
+                              [comp['props'] for comp in components])
+            self._extend_rows(results_data, 'import',
+                              [imp['items'] for imp in imports],
+                              [imp['source'] for imp in imports])
+            self._extend_rows(results_data, 'frontmatter',
+                              list(frontmatter),
+                              [str(value) for value in frontmatter.values()])
             
-            # Add frontmatter to DataFrame
-            for key, value in frontmatter.items():
-                results_data.append({
-                    'type': 'frontmatter',
-                    'name': key,
-                    'content': str(value),
-                    'props': '',
-                    'file_path': file_path
-                })
+            # Component props stay native dicts; writers stringify them once at output time
+            results_data['file_path'] = [file_path] * len(results_data['type'])
 
             # Update the results DataFrame
-            self.results_df = pd.DataFrame(results_data)
+            self.results_df = pd.DataFrame(results_data, copy=False)
 
-            return {
+            result = {
                 'components': components,
                 'imports': imports,
                 'frontmatter': frontmatter,
                 'file_info': {
                     'path': file_path,
-                    'size': os.path.getsize(file_path),
-                    'modified': datetime.fromtimestamp(os.path.getmtime(file_path))
+                    'size': stat.st_size,
+                    'modified': datetime.fromtimestamp(stat.st_mtime)
                 }
             }
+            self._cache.put(file_path, cache_key, result, copy.deepcopy(results_data))
+            return result
 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
             return None
 
+    def _extend_rows(self, results_data: Dict[str, List], row_type: str, names: List[str],
+                     contents: List[Any], props: Optional[List[Any]] = None) -> None:
+        """Append a batch of rows of one type to the column lists; props default to ''."""
+        count = len(names)
+        results_data['type'].extend([row_type] * count)
+        results_data['name'].extend(names)
+        results_data['content'].extend(contents)
+        results_data['props'].extend(props if props is not None else [''] * count)
+
+    def _parse_flat_frontmatter(self, frontmatter_str: str) -> Optional[Dict[str, Any]]:
+        """Parse simple flat frontmatter, or return None if YAML is needed."""
+        frontmatter = {}
+        for line in frontmatter_str.splitlines():
+            if not line.strip():
+                continue
+            key, sep, raw_value = line.partition(':')
+            value = raw_value.strip()
+            if (not sep or not raw_value.startswith(' ') or not value
+                    or not _FM_KEY_RE.fullmatch(key) or key.lower() in _YAML_KEYWORDS):
+                return None
+            if _FM_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_KEYWORDS:
+                frontmatter[key] = value
+            elif _FM_INT_RE.fullmatch(value):
+                frontmatter[key] = int(value)
+            elif _FM_DATE_RE.fullmatch(value):
+                try:
+                    frontmatter[key] = date.fromisoformat(value)
+                except ValueError:
+                    return None
+            else:
+                return None
+        return frontmatter
+
+    def _extract_component_props(self, content: str,
+                                 spans: List[Tuple[int, int]]) -> List[Dict[str, str]]:
+        """
+        Extract the props of every component with a single scan of content.
+        
+        Args:
+            content: The file content
+            spans: Sorted, non-overlapping (start, end) spans of each component's props
+            
+        Returns:
+            One props dictionary per span
+        """
+        all_props = [{} for _ in spans]
+        if not spans:
+            return all_props
+        starts = [start for start, _ in spans]
+        dirty = {idx for idx, start in enumerate(starts) if _MID_WORD_RE.match(content, start)}
+        for match in _PROP_RE.finditer(content, starts[0], spans[-1][1]):
+            start, end = match.span()
+            idx = bisect_right(starts, start) - 1
+            if idx >= 0 and end <= spans[idx][1]:
+                all_props[idx][match.group(1)] = match.group(2) or match.group(3)
+                continue
+            # A match crossing a span boundary could not occur in that span on its
+            # own and may hide matches that do, so rescan the spans it touches
+            idx = max(idx, 0)
+            while idx < len(spans) and spans[idx][0] < end:
+                if spans[idx][1] > start:
+                    dirty.add(idx)
+                idx += 1
+        for idx in dirty:
+            start, end = spans[idx]
+            all_props[idx] = self._extract_props(content[start:end])
+        return all_props
+
     def _extract_props(self, component_str: str) -> Dict[str, str]:
         """Extract properties from a component string."""
         props = {}
-        for match in self.prop_pattern.finditer(component_str):
+        for match in _PROP_RE.finditer(component_str):
             name = match.group(1)
             value = match.group(2) or match.group(3)
             props[name] = value
@@ -10,24 +10,91 @@ This processor extracts structured information from Python source files, includi
 """
 
 import ast
+import codecs
+import inspect
+import json
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import accumulate
 import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from ..file_processor import FileProcessor
 from ..processing_result import PythonProcessingResult
+from .. import _result_cache
+from ._file_cache import FileCache
 
 # Set up a logger for debug output
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _read_source(file_path: str, stat: Optional[os.stat_result] = None
+                 ) -> Tuple[Optional[os.stat_result], Optional[bytes], Optional[str]]:
+    """Stat (unless already done) and read a source file, returning (stat, raw content, error message)."""
+    # A single stat both checks existence and supplies file_info
+    if stat is None:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None, None, f"Error reading file: File not found - {file_path}"
+
+    try:
+        content = Path(file_path).read_bytes()
+    except Exception as e:
+        return stat, None, f"Error reading file: {str(e)}"
+    # The source stays undecoded: ast.parse reads bytes itself and node text
+    # is decoded slice by slice. Line endings are normalized as text mode would.
+    if content.startswith(codecs.BOM_UTF8):
+        content = content[len(codecs.BOM_UTF8):]
+    if b'\r' in content:
+        content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return stat, content, None
+
+# Props of rows that carry no per-node data
+_EMPTY_PROPS = '{}'
+
+# Columns of the results DataFrame, in order
+_COLUMNS = ('filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type')
+
+def _arg_names(arguments: ast.arguments) -> List[str]:
+    """Return the names of positional-only, regular and keyword-only parameters, in order."""
+    return [arg.arg for params in (arguments.posonlyargs, arguments.args, arguments.kwonlyargs)
+            for arg in params]
+
+def _docstring(node: ast.AST) -> str:
+    """Return the cleaned docstring of a function or class, as ast.get_docstring does, or ''."""
+    body = node.body
+    if not body or type(body[0]) is not ast.Expr:
+        return ''
+    value = body[0].value
+    if type(value) is not ast.Constant or type(value.value) is not str:
+        return ''
+    text = value.value
+    # cleandoc only strips the leading whitespace of a one-line docstring
+    if '\n' not in text:
+        return text.expandtabs().lstrip()
+    return inspect.cleandoc(text)
+
+def _new_columns() -> Dict[str, List]:
+    """Return empty per-column lists for results rows."""
+    return {column: [] for column in _COLUMNS}
+
 class PythonProcessor(FileProcessor):
     """Processor for Python source files."""
     
-    def __init__(self, debug: bool = False):
-        """Initialize the Python processor."""
+    def __init__(self, debug: bool = False, cache_dir: Optional[str] = None):
+        """
+        Initialize the Python processor.
+        
+        Args:
+            debug: Enable debug logging
+            cache_dir: Directory for caching results across runs; None disables caching
+        """
         super().__init__()
         self.debug = debug
+        self.cache_dir = cache_dir
         if self.debug:
             logger.setLevel(logging.DEBUG)
         self.supported_types = {
@@ -37,10 +104,34 @@ class PythonProcessor(FileProcessor):
             'application/x-python-code',
             'text/x-python-executable'  # For .pyw files
         }
-        self._all_results = []  # Store all results to combine later
         self._current_path = []  # Track current path in AST
         self._order_counter = 0  # Track order of elements
         
+        # Results and rows of recently processed files, reused while unchanged
+        self._cache = FileCache()
+        
+    @property
+    def results_df(self) -> pd.DataFrame:
+        """Combined results of every processed file."""
+        return self.flush()
+    
+    @results_df.setter
+    def results_df(self, df: pd.DataFrame) -> None:
+        self._results_df = df
+        self._row_buffer = _new_columns()
+        
+    def flush(self) -> pd.DataFrame:
+        """Add the rows buffered since the last flush to results_df in one batch."""
+        if self._row_buffer['order']:
+            # Rows are staged as one list per column, already in column order
+            df = pd.DataFrame(self._row_buffer, copy=False)
+            if not self._results_df.empty:
+                self._results_df = pd.concat([self._results_df, df], ignore_index=True)
+            else:
+                self._results_df = df
+            self._row_buffer = _new_columns()
+        return self._results_df
+        
     def get_supported_types(self) -> List[str]:
         """Return list of supported MIME types."""
         return list(self.supported_types)
@@ -59,203 +150,314 @@ class PythonProcessor(FileProcessor):
             - errors: List of any errors encountered
             - file_info: Dictionary with file metadata
         """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            stat = None
+        else:
+            # Unchanged files are served from memory without even being read
+            cached = self._cached_result(file_path, stat)
+            if cached is not None:
+                return cached
+        return self._process_source(file_path, *_read_source(file_path, stat))
+
+    def process_files(self, file_paths: List[str], max_workers: Optional[int] = None,
+                      use_processes: bool = False) -> List[PythonProcessingResult]:
+        """
+        Process several Python files, reading or parsing them concurrently.
+        
+        By default a thread pool reads upcoming files while earlier ones are
+        parsed, so disk latency overlaps with parsing instead of adding up
+        file by file. At most two reads per thread are queued ahead of
+        parsing, and unchanged files are served from memory without being
+        read. Parsing itself holds the GIL; with use_processes the files are
+        read and parsed in a pool of worker processes instead.
+        
+        Args:
+            file_paths: Paths to the Python files
+            max_workers: Number of reader threads (default 32) or worker
+                processes (default: one per CPU)
+            use_processes: Parse in worker processes rather than in this one
+            
+        Returns:
+            One PythonProcessingResult per file, in the order of file_paths
+        """
+        file_paths = list(file_paths)
+        if use_processes:
+            worker = partial(_process_in_worker, debug=self.debug, cache_dir=self.cache_dir)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = []
+                for result, results_data in executor.map(worker, file_paths, chunksize=16):
+                    self._extend_buffer(results_data)
+                    results.append(result)
+                return results
+        
+        max_workers = max_workers or 32
+        results = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Reads run a bounded window ahead, so sources don't pile up
+            # in memory when reading outpaces parsing
+            queued = deque()
+            for file_path in file_paths:
+                queued.append((file_path, self._queue_read(executor, file_path)))
+                if len(queued) >= 2 * max_workers:
+                    results.append(self._take_read(*queued.popleft()))
+            while queued:
+                results.append(self._take_read(*queued.popleft()))
+        return results
+
+    def _queue_read(self, executor: ThreadPoolExecutor, file_path: str) -> Any:
+        """Return the cached (result, rows) of an unchanged file, or a future reading it."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return executor.submit(_read_source, file_path)
+        cached = self._cache.get(file_path, (stat.st_mtime_ns, stat.st_size))
+        if cached is not None:
+            return cached
+        return executor.submit(_read_source, file_path, stat)
+
+    def _take_read(self, file_path: str, queued: Any) -> PythonProcessingResult:
+        """Process a file queued by _queue_read, in queue order."""
+        if isinstance(queued, Future):
+            return self._process_source(file_path, *queued.result())
+        logger.debug(f"Reusing results for unchanged {file_path}")
+        result, rows = queued
+        self._extend_buffer(rows)
+        return result
+
+    def _process_source(self, file_path: str, stat: Optional[os.stat_result],
+                        content: Optional[bytes], error_msg: Optional[str]) -> PythonProcessingResult:
+        """Extract structured information from a file read by _read_source."""
         # Reset order counter for each file
         self._order_counter = 0
         path = Path(file_path)
         result = PythonProcessingResult()
-        results_data = []
+        results_data = _new_columns()
 
-        if not path.exists():
-            error_msg = f"Error reading file: File not found - {file_path}"
+        if error_msg is not None:
             result.errors.append(error_msg)
             logger.error(error_msg)
             return result
 
-        try:
-            content = path.read_text()
-        except Exception as e:
-            error_msg = f"Error reading file: {str(e)}"
-            result.errors.append(error_msg)
-            logger.error(error_msg)
-            return result
+        cached = self._cached_result(file_path, stat)
+        if cached is not None:
+            return cached
 
+        # Resolved once and shared by file_info and every row of the file
+        abs_path = str(path.absolute())
         result.file_info = {
             'name': path.name,
-            'path': str(path.absolute()),
-            'size': path.stat().st_size,
-            'last_modified': path.stat().st_mtime
+            'path': abs_path,
+            'size': stat.st_size,
+            'last_modified': stat.st_mtime
         }
 
-        try:
-            logger.debug("Parsing Python AST")
-            tree = ast.parse(content)
-            logger.debug("Processing Python nodes")
-            self._process_node(tree, result, results_data, file_path)
-        except SyntaxError as e:
-            error_msg = f"Python syntax error: {str(e)}"
-            result.errors.append(error_msg)
-            logger.error(error_msg)
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            result.errors.append(error_msg)
-            logger.error(error_msg)
+        # Unchanged files are served from the on-disk cache without parsing
+        cache_key = None
+        cached = None
+        if self.cache_dir is not None:
+            cache_key = _result_cache.cache_key('python', str(file_path), content)
+            cached = _result_cache.load(self.cache_dir, cache_key)
+        
+        if cached is not None:
+            logger.debug(f"Using cached results for {file_path}")
+            result.functions, result.classes, results_data = cached
+        else:
+            try:
+                logger.debug("Parsing Python AST")
+                tree = ast.parse(content)
+                logger.debug("Processing Python nodes")
+                self._set_source(content)
+                self._process_node(tree, result, results_data, file_path)
+            except SyntaxError as e:
+                error_msg = f"Python syntax error: {str(e)}"
+                result.errors.append(error_msg)
+                logger.error(error_msg)
+            except Exception as e:
+                error_msg = f"Unexpected error: {str(e)}"
+                result.errors.append(error_msg)
+                logger.error(error_msg)
+
+            if cache_key is not None and not result.errors:
+                _result_cache.store(self.cache_dir, cache_key,
+                                    (result.functions, result.classes, results_data))
 
         # Store results data for later DataFrame creation
-        if results_data:
+        row_count = len(results_data['order'])
+        if row_count:
             # Add file info to each result
-            for data in results_data:
-                data['filepath'] = str(path.absolute())
-            self._all_results.extend(results_data)
-            logger.debug(f"Added {len(results_data)} rows from {file_path}")
-            
-            # Update the combined DataFrame with specific column order
-            df = pd.DataFrame(self._all_results)
-            # Rename 'type' to 'processor_type' for clarity
-            df = df.rename(columns={'type': 'processor_type'})
-            # Reorder columns
-            column_order = ['filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type']
-            self.results_df = df[column_order]
+            results_data['filepath'] = [abs_path] * row_count
+            # Rows are buffered and turned into a DataFrame once on flush()
+            # instead of rebuilding the combined results after every file
+            self._extend_buffer(results_data)
+            logger.debug(f"Added {row_count} rows from {file_path}")
             
+        self._cache.put(file_path, (stat.st_mtime_ns, stat.st_size), result, results_data)
+        return result
+
+    def _cached_result(self, file_path: str, stat: os.stat_result) -> Optional[PythonProcessingResult]:
+        """Return the previous result for an unchanged file, buffering its rows again."""
+        cached = self._cache.get(file_path, (stat.st_mtime_ns, stat.st_size))
+        if cached is None:
+            return None
+        logger.debug(f"Reusing results for unchanged {file_path}")
+        result, rows = cached
+        self._extend_buffer(rows)
         return result
 
+    def _extend_buffer(self, results_data: Dict[str, List]) -> None:
+        """Append one file's column lists to the row buffer."""
+        for column, values in results_data.items():
+            self._row_buffer[column].extend(values)
+
+    def _append_row(self, results_data: Dict[str, List], row_type: str, name: str,
+                    content: str, props: str) -> None:
+        """Append one row at the current path and order; filepath is filled in per file."""
+        results_data['parent_path'].append(self._get_current_path())
+        results_data['order'].append(self._order_counter)
+        results_data['name'].append(name)
+        results_data['content'].append(content)
+        results_data['props'].append(props)
+        results_data['processor_type'].append(row_type)
+
+    def _set_source(self, content: bytes) -> None:
+        """Remember the source being processed so node text can be sliced from it."""
+        # AST column offsets count UTF-8 bytes, so slice the undecoded source
+        self._source = content
+        # Start offset of every line; line endings were normalized to b'\n'
+        self._line_offsets = [0, *accumulate(map(len, content.splitlines(keepends=True)))]
+
+    def _get_source(self, node: ast.AST) -> str:
+        """Return the source text of a node, including any decorators."""
+        start_line = node.lineno
+        decorators = getattr(node, 'decorator_list', None)
+        if decorators:
+            # Decorators sit at the same indentation as the definition
+            start_line = decorators[0].lineno
+        start = self._line_offsets[start_line - 1] + node.col_offset
+        end = self._line_offsets[node.end_lineno - 1] + node.end_col_offset
+        return self._source[start:end].decode('utf-8')
+
     def _get_current_path(self) -> str:
         """Get the current path in dot notation."""
         return '.'.join(self._current_path) if self._current_path else ''
 
-    def _process_node(self, node: ast.AST, result: PythonProcessingResult, results_data: List[Dict], file_path: str) -> None:
-        """Process a Python AST node and extract information."""
-        if isinstance(node, ast.FunctionDef):
-            self._process_function(node, result, results_data, file_path)
-        elif isinstance(node, ast.ClassDef):
-            self._process_class(node, result, results_data, file_path)
-        elif isinstance(node, ast.Module):
-            # Process module-level nodes
-            for child in ast.iter_child_nodes(node):
-                self._process_node(child, result, results_data, file_path)
-        elif isinstance(node, (ast.Import, ast.ImportFrom)):
-            self._process_import(node, results_data, file_path)
-        elif isinstance(node, ast.Assign):
-            self._process_assignment(node, results_data, file_path)
-        else:
-            # Recursively process other nodes
-            for child in ast.iter_child_nodes(node):
-                self._process_node(child, result, results_data, file_path)
+    def _process_node(self, node: ast.AST, result: PythonProcessingResult, results_data: Dict[str, List], file_path: str) -> None:
+        """
+        Process a Python AST node and everything below it.
+        
+        Nodes are visited in source order from an explicit stack rather than by
+        recursion. Entering a function or class pushes the callback that closes
+        its scope underneath its children, so it runs once they are done.
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, ast.AST):
+                node()
+                continue
+            
+            node_type = type(node)
+            if node_type is ast.FunctionDef:
+                self._process_function(node, result, results_data, file_path)
+                stack.append(self._current_path.pop)
+                # Only nested functions are processed inside a function
+                children = [child for child in ast.iter_child_nodes(node)
+                            if isinstance(child, ast.FunctionDef)]
+            elif node_type is ast.ClassDef:
+                class_info = self._process_class(node, result, results_data, file_path)
+                stack.append(partial(self._close_class, class_info, result))
+                # Only methods and nested classes are processed inside a class
+                children = [child for child in ast.iter_child_nodes(node)
+                            if isinstance(child, (ast.FunctionDef, ast.ClassDef))]
+            elif node_type is ast.Import or node_type is ast.ImportFrom:
+                self._process_import(node, results_data, file_path)
+                continue
+            elif node_type is ast.Assign:
+                self._process_assignment(node, results_data, file_path)
+                continue
+            else:
+                children = list(ast.iter_child_nodes(node))
+            stack.extend(reversed(children))
 
-    def _process_function(self, node: ast.FunctionDef, result: PythonProcessingResult, results_data: List[Dict], file_path: str) -> None:
-        """Process a function definition node."""
-        # Add function name to current path
+    def _process_function(self, node: ast.FunctionDef, result: PythonProcessingResult, results_data: Dict[str, List], file_path: str) -> None:
+        """Process a function definition node, entering its scope."""
+        # Add function name to current path; _process_node removes it
         self._current_path.append(node.name)
         self._order_counter += 1  # Increment counter
         
         function_info = {
             'name': node.name,
-            'docstring': ast.get_docstring(node) or '',
+            'docstring': _docstring(node),
             'type': 'method' if self._current_path[:-1] else 'function',  # If has parent, it's a method
-            'args': [arg.arg for arg in node.args.args],
+            'args': _arg_names(node.args),
             'returns': None,  # We'll add return type hints later
-            'content': ast.unparse(node),
+            'content': self._get_source(node),
             'filepath': file_path,
             'parent_path': self._get_current_path(),
             'order': self._order_counter
         }
         
         result.functions.append(function_info)
-        results_data.append({
-            'type': function_info['type'],
-            'name': node.name,
-            'content': function_info['content'],
-            'props': str({'args': function_info['args'], 'returns': function_info['returns']}),
-            'filepath': file_path,
-            'parent_path': self._get_current_path(),
-            'order': self._order_counter
-        })
-        
-        # Process nested functions
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, ast.FunctionDef):
-                self._process_function(child, result, results_data, file_path)
-        
-        # Remove function name from current path
-        self._current_path.pop()
+        self._append_row(results_data, function_info['type'], node.name, function_info['content'],
+                         json.dumps({'args': function_info['args'], 'returns': function_info['returns']}))
 
-    def _process_class(self, node: ast.ClassDef, result: PythonProcessingResult, results_data: List[Dict], file_path: str) -> None:
-        """Process a class definition node."""
-        # Add class name to current path
+    def _process_class(self, node: ast.ClassDef, result: PythonProcessingResult, results_data: Dict[str, List], file_path: str) -> Dict:
+        """Process a class definition node, entering its scope."""
+        # Add class name to current path; _close_class removes it
         self._current_path.append(node.name)
         self._order_counter += 1  # Increment counter
         
         class_info = {
             'name': node.name,
-            'docstring': ast.get_docstring(node) or '',
+            'docstring': _docstring(node),
             'type': 'class',
-            'bases': [ast.unparse(base) for base in node.bases],
-            'content': ast.unparse(node),
+            'bases': [self._get_source(base) for base in node.bases],
+            'content': self._get_source(node),
             'filepath': file_path,
             'parent_path': self._get_current_path(),
             'order': self._order_counter
         }
         
-        results_data.append({
-            'type': 'class',
-            'name': node.name,
-            'content': class_info['content'],
-            'props': str({'bases': class_info['bases']}),
-            'filepath': file_path,
-            'parent_path': self._get_current_path(),
-            'order': self._order_counter
-        })
-        
-        # Process class methods and nested classes
-        for child in ast.iter_child_nodes(node):
-            if isinstance(child, (ast.FunctionDef, ast.ClassDef)):
-                self._process_node(child, result, results_data, file_path)
-        
+        self._append_row(results_data, 'class', node.name, class_info['content'],
+                         json.dumps({'bases': class_info['bases']}))
+        return class_info
+
+    def _close_class(self, class_info: Dict, result: PythonProcessingResult) -> None:
+        """Leave a class scope once its methods and nested classes are processed."""
         result.classes.append(class_info)
         
         # Remove class name from current path
         self._current_path.pop()
 
-    def _process_import(self, node: ast.AST, results_data: List[Dict], file_path: str) -> None:
+    def _process_import(self, node: ast.AST, results_data: Dict[str, List], file_path: str) -> None:
         """Process an import statement."""
         self._order_counter += 1  # Increment counter
+        content = self._get_source(node)
         
         if isinstance(node, ast.Import):
             for name in node.names:
-                results_data.append({
-                    'type': 'import',
-                    'name': name.name,
-                    'content': ast.unparse(node),
-                    'props': str({'asname': name.asname}),
-                    'filepath': file_path,
-                    'parent_path': self._get_current_path(),
-                    'order': self._order_counter
-                })
+                self._append_row(results_data, 'import', name.name, content,
+                                 json.dumps({'asname': name.asname}))
         elif isinstance(node, ast.ImportFrom):
             module = node.module or ''
             for name in node.names:
-                results_data.append({
-                    'type': 'import_from',
-                    'name': f"{module}.{name.name}",
-                    'content': ast.unparse(node),
-                    'props': str({'asname': name.asname, 'module': module}),
-                    'filepath': file_path,
-                    'parent_path': self._get_current_path(),
-                    'order': self._order_counter
-                })
-
-    def _process_assignment(self, node: ast.Assign, results_data: List[Dict], file_path: str) -> None:
+                self._append_row(results_data, 'import_from', f"{module}.{name.name}", content,
+                                 json.dumps({'asname': name.asname, 'module': module}))
+
+    def _process_assignment(self, node: ast.Assign, results_data: Dict[str, List], file_path: str) -> None:
         """Process an assignment statement."""
         # Only process module-level or class-level assignments
         if len(self._current_path) <= 1:
             self._order_counter += 1  # Increment counter
+            content = self._get_source(node)
             for target in node.targets:
                 if isinstance(target, ast.Name):
-                    results_data.append({
-                        'type': 'declaration',
-                        'name': target.id,
-                        'content': ast.unparse(node),
-                        'props': str({}),
-                        'filepath': file_path,
-                        'parent_path': self._get_current_path(),
-                        'order': self._order_counter
-                    })
\ No newline at end of file
+                    self._append_row(results_data, 'declaration', target.id, content, _EMPTY_PROPS)
+
+def _process_in_worker(file_path: str, debug: bool, cache_dir: Optional[str]) -> Tuple[PythonProcessingResult, Dict[str, List]]:
+    """Process one file in a worker process, returning its result and row columns."""
+    processor = PythonProcessor(debug=debug, cache_dir=cache_dir)
+    result = processor.process_file(file_path)
+    return result, processor._row_buffer
@@ -10,17 +10,133 @@ This processor extracts structured information from shell scripts, including:
 """
 
 import re
-import ast
+import json
+import locale
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import pandas as pd
 
 from ..file_processor import FileProcessor
 from ..processing_result import ShellProcessingResult
+from ._file_cache import FileCache
+
+try:
+    import hyperscan  # Optional SIMD multi-pattern matcher
+except ImportError:
+    hyperscan = None
 
 logger = logging.getLogger(__name__)
 
+# Patterns for each element type; every one of them starts at a line start
+_FUNCTION_PATTERN = r'(?:function\s+)?(?P<function_name>\w+)\s*\(\s*\)\s*{'
+_VARIABLE_PATTERN = r'(?P<variable_name>[A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?P<variable_value>.+)$'
+_ALIAS_PATTERN = r'alias\s+(?P<alias_name>[^=]+)=(?P<alias_value>.+)$'
+_SOURCE_PATTERN = r'(?:source|\.)\s+(?P<source_path>[^\s;]+)'
+
+# All four element types found in one scan, compiled once at import time.
+# Lines that can't start any element are rejected by the cheap prefix check;
+# the rest try each pattern in a lookahead, so nothing is consumed and a line
+# can match several types, exactly as with one scan per pattern.
+_ELEMENT_TYPES = ('function', 'variable', 'alias', 'source')
+_ELEMENT_RE = re.compile(
+    r'^(?=(?:function\s+)?\w+\s*\(\s*\)\s*{|[A-Za-z_][A-Za-z0-9_]*\s*=\s*.|alias\s+[^=]+=.|(?:source|\.)\s+[^\s;])'
+    rf'(?:(?=(?P<function>{_FUNCTION_PATTERN})))?'
+    rf'(?:(?=(?P<variable>{_VARIABLE_PATTERN})))?'
+    rf'(?:(?=(?P<alias>{_ALIAS_PATTERN})))?'
+    rf'(?:(?=(?P<source>{_SOURCE_PATTERN})))?',
+    re.MULTILINE)
+
+# Hyperscan versions of the line-start check at the front of _ELEMENT_RE,
+# used to find the lines worth matching. Hyperscan's classes are ASCII-only,
+# so they only run on ASCII content, and whitespace is widened to every ASCII
+# character Python's \s matches; each hit is still confirmed by _ELEMENT_RE.
+_HS_SPACE = rb'[\t-\r\x1c- ]'
+_HS_ELEMENT_STARTS = (
+    rb'^(?:function' + _HS_SPACE + rb'+)?\w+' + _HS_SPACE + rb'*\(' + _HS_SPACE + rb'*\)' + _HS_SPACE + rb'*\{',
+    rb'^[A-Za-z_][A-Za-z0-9_]*' + _HS_SPACE + rb'*=' + _HS_SPACE + rb'*.',
+    rb'^alias' + _HS_SPACE + rb'+[^=]+=.',
+    rb'^(?:source|\.)' + _HS_SPACE + rb'+[^\t-\r\x1c- ;]',
+)
+_hs_database = None
+
+def _get_hs_database():
+    """Compile the line-start database on first use, or return None without hyperscan."""
+    global _hs_database
+    if _hs_database is None and hyperscan is not None:
+        database = hyperscan.Database()
+        flags = hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_SOM_LEFTMOST
+        database.compile(
+            expressions=list(_HS_ELEMENT_STARTS),
+            ids=list(range(len(_HS_ELEMENT_STARTS))),
+            flags=[flags] * len(_HS_ELEMENT_STARTS)
+        )
+        _hs_database = database
+    return _hs_database
+
+def _iter_element_matches(content: str):
+    """Yield the _ELEMENT_RE match at every line start where an element begins."""
+    database = _get_hs_database()
+    if database is None or not content.isascii():
+        yield from _ELEMENT_RE.finditer(content)
+        return
+    starts = set()
+    database.scan(content.encode('ascii'),
+                  match_event_handler=lambda _id, start, _end, _flags, _context: starts.add(start))
+    for start in sorted(starts):
+        match = _ELEMENT_RE.match(content, start)
+        if match is not None:
+            yield match
+
+# Scripts at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+def _read_script(path: Path, size: int) -> str:
+    """
+    Read a shell script as Path.read_text would, with universal newlines.
+    
+    Large scripts are decoded straight from a read-only memory map rather
+    than read into a bytes copy first, so only the decoded text is held
+    in private memory; the mapped pages stay in the shared page cache.
+    """
+    if size < _MMAP_THRESHOLD:
+        return path.read_text()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        content = str(mm, locale.getpreferredencoding(False))
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+# Characters that open or close a code block or a quoted string
+_BLOCK_DELIMITER_RE = re.compile(r'["\'{}]')
+
+def _scan_elements(content: str) -> Dict[str, List[re.Match]]:
+    """
+    Find every function, variable, alias and source statement in one scan.
+    
+    Returns the matches of each element type in file order. A match is
+    skipped when it starts inside the previous match of the same type, as
+    a separate finditer over that type's pattern would skip it.
+    """
+    elements = {element_type: [] for element_type in _ELEMENT_TYPES}
+    ends = dict.fromkeys(_ELEMENT_TYPES, 0)
+    for match in _iter_element_matches(content):
+        for element_type in _ELEMENT_TYPES:
+            start = match.start(element_type)
+            if start >= ends[element_type]:
+                ends[element_type] = match.end(element_type)
+                elements[element_type].append(match)
+    return elements
+
+# Columns of the results DataFrame, in order
+_COLUMNS = ('filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type')
+
+def _new_columns() -> Dict[str, List]:
+    """Return empty per-column lists for results rows."""
+    return {column: [] for column in _COLUMNS}
+
 class ShellProcessor(FileProcessor):
     """Processor for shell script files."""
     
@@ -41,14 +157,33 @@ class ShellProcessor(FileProcessor):
         # Initialize tracking variables
         self._all_results = []  # Store all results
         self._current_path = []  # Track path for nested functions
+        self._parent_path = ''  # _current_path joined, for the file being processed
         self._order_counter = 0  # Track element order
         
-        # Initialize regex patterns
-        self._function_pattern = re.compile(r'^(?:function\s+)?(\w+)\s*\(\s*\)\s*{', re.MULTILINE)
-        self._variable_pattern = re.compile(r'^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.+)$', re.MULTILINE)
-        self._alias_pattern = re.compile(r'^alias\s+([^=]+)=(.+)$', re.MULTILINE)
-        self._source_pattern = re.compile(r'^(?:source|\.)\s+([^\s;]+)', re.MULTILINE)
-        self._comment_pattern = re.compile(r'^#\s*(.+)$', re.MULTILINE)
+        # Results and rows of recently processed files, reused while unchanged
+        self._cache = FileCache()
+        
+    @property
+    def results_df(self) -> pd.DataFrame:
+        """Combined results of every processed file."""
+        return self.flush()
+    
+    @results_df.setter
+    def results_df(self, df: pd.DataFrame) -> None:
+        self._results_df = df
+        self._row_buffer = _new_columns()
+        
+    def flush(self) -> pd.DataFrame:
+        """Add the rows buffered since the last flush to results_df in one batch."""
+        if self._row_buffer['order']:
+            # Rows are staged as one list per column, already in column order
+            df = pd.DataFrame(self._row_buffer, copy=False)
+            if not self._results_df.empty:
+                self._results_df = pd.concat([self._results_df, df], ignore_index=True)
+            else:
+                self._results_df = df
+            self._row_buffer = _new_columns()
+        return self._results_df
         
     def get_supported_types(self) -> List[str]:
         """Return list of supported MIME types."""
@@ -60,16 +195,27 @@ class ShellProcessor(FileProcessor):
         self._order_counter = 0
         path = Path(file_path)
         result = ShellProcessingResult()
-        results_data = []
+        results_data = _new_columns()
         
-        if not path.exists():
+        # A single stat both checks existence and supplies file_info
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             error_msg = f"Error reading file: File not found - {file_path}"
             result.errors.append(error_msg)
             logger.error(error_msg)
             return result
             
+        # Reuse the previous result while the file is unchanged
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(file_path, cache_key)
+        if cached is not None:
+            result, rows = cached
+            self._extend_buffer(rows)
+            return result
+            
         try:
-            content = path.read_text()
+            content = _read_script(path, stat.st_size)
         except Exception as e:
             error_msg = f"Error reading file: {str(e)}"
             result.errors.append(error_msg)
@@ -79,163 +225,177 @@ class ShellProcessor(FileProcessor):
         result.file_info = {
             'name': path.name,
             'path': str(path.absolute()),
-            'size': path.stat().st_size,
-            'last_modified': path.stat().st_mtime
+            'size': stat.st_size,
+            'last_modified': stat.st_mtime
         }
         
         try:
+            # The path doesn't change while a file is scanned, so join it once
+            self._parent_path = self._get_current_path()
             # Process each element type
-            self._process_functions(content, result, results_data, file_path)
-            self._process_variables(content, result, results_data, file_path)
-            self._process_aliases(content, result, results_data, file_path)
-            self._process_sources(content, result, results_data, file_path)
+            elements = _scan_elements(content)
+            self._process_functions(content, elements['function'], result, results_data, file_path)
+            self._process_variables(elements['variable'], result, results_data, file_path)
+            self._process_aliases(elements['alias'], result, results_data, file_path)
+            self._process_sources(elements['source'], result, results_data, file_path)
         except Exception as e:
             error_msg = f"Error processing content: {str(e)}"
             result.errors.append(error_msg)
             logger.error(error_msg)
             
-        # Create DataFrame from results
-        if results_data:
-            df = pd.DataFrame(results_data)
-            df = df.rename(columns={'type': 'processor_type'})
-            column_order = ['filepath', 'parent_path', 'order', 'name', 
-                          'content', 'props', 'processor_type']
-            df = df[column_order]
-            
-            # Concatenate with existing results if any
-            if hasattr(self, 'results_df') and not self.results_df.empty:
-                self.results_df = pd.concat([self.results_df, df], ignore_index=True)
-            else:
-                self.results_df = df
+        # Rows are buffered and turned into a DataFrame once on flush()
+        # instead of rebuilding the combined results after every file
+        self._extend_buffer(results_data)
             
+        self._cache.put(file_path, cache_key, result, results_data)
         return result
         
-    def _process_functions(self, content: str, result: ShellProcessingResult, 
-                         results_data: List[Dict], file_path: str) -> None:
+    def _extend_buffer(self, results_data: Dict[str, List]) -> None:
+        """Append one file's column lists to the row buffer."""
+        for column, values in results_data.items():
+            self._row_buffer[column].extend(values)
+        
+    def _process_functions(self, content: str, matches: List[re.Match], result: ShellProcessingResult, 
+                         results_data: Dict[str, List], file_path: str) -> None:
         """Process shell function definitions."""
-        for match in self._function_pattern.finditer(content):
+        for match in matches:
             self._order_counter += 1
-            func_name = match.group(1)
+            func_name = match.group('function_name')
             
             # Find the function body
             start = match.start()
-            body = self._extract_block(content[start:])
+            body = self._extract_block(content, start)
             
             # Get function documentation (comments above the function)
-            doc = self._extract_doc_comment(content[:start])
+            doc = self._extract_doc_comment(content, start)
             
             function_info = {
                 'name': func_name,
                 'type': 'function',
                 'content': body,
-                'props': str({'doc': doc}),
+                'props': json.dumps({'doc': doc}),
                 'filepath': file_path,
-                'parent_path': self._get_current_path(),
                 'order': self._order_counter
             }
             
             result.functions.append(function_info)
-            results_data.append(function_info)
+            self._append_row(results_data, function_info)
             
-    def _process_variables(self, content: str, result: ShellProcessingResult, 
-                         results_data: List[Dict], file_path: str) -> None:
+    def _process_variables(self, matches: List[re.Match], result: ShellProcessingResult, 
+                         results_data: Dict[str, List], file_path: str) -> None:
         """Process variable declarations."""
-        for match in self._variable_pattern.finditer(content):
+        for match in matches:
             self._order_counter += 1
-            var_name = match.group(1)
-            var_value = match.group(2).strip()
+            var_name = match.group('variable_name')
+            var_value = match.group('variable_value').strip()
             
             variable_info = {
                 'name': var_name,
                 'type': 'variable',
                 'content': f"{var_name}={var_value}",
-                'props': str({'value': var_value}),
+                'props': json.dumps({'value': var_value}),
                 'filepath': file_path,
-                'parent_path': self._get_current_path(),
                 'order': self._order_counter
             }
             
             result.variables.append(variable_info)
-            results_data.append(variable_info)
+            self._append_row(results_data, variable_info)
             
-    def _process_aliases(self, content: str, result: ShellProcessingResult, 
-                        results_data: List[Dict], file_path: str) -> None:
+    def _process_aliases(self, matches: List[re.Match], result: ShellProcessingResult, 
+                        results_data: Dict[str, List], file_path: str) -> None:
         """Process alias definitions."""
-        for match in self._alias_pattern.finditer(content):
+        for match in matches:
             self._order_counter += 1
-            alias_name = match.group(1).strip()
-            alias_value = match.group(2).strip()
+            alias_name = match.group('alias_name').strip()
+            alias_value = match.group('alias_value').strip()
             
             alias_info = {
                 'name': alias_name,
                 'type': 'alias',
                 'content': f"alias {alias_name}={alias_value}",
-                'props': str({'value': alias_value}),
+                'props': json.dumps({'value': alias_value}),
                 'filepath': file_path,
-                'parent_path': self._get_current_path(),
                 'order': self._order_counter
             }
             
             result.aliases.append(alias_info)
-            results_data.append(alias_info)
+            self._append_row(results_data, alias_info)
             
-    def _process_sources(self, content: str, result: ShellProcessingResult, 
-                        results_data: List[Dict], file_path: str) -> None:
+    def _process_sources(self, matches: List[re.Match], result: ShellProcessingResult, 
+                        results_data: Dict[str, List], file_path: str) -> None:
         """Process source/include statements."""
-        for match in self._source_pattern.finditer(content):
+        for match in matches:
             self._order_counter += 1
-            source_path = match.group(1)
+            source_path = match.group('source_path')
             
             source_info = {
                 'name': source_path,
                 'type': 'source',
-                'content': match.group(0),
-                'props': str({}),
+                'content': match.group('source'),
+                'props': '{}',
                 'filepath': file_path,
-                'parent_path': self._get_current_path(),
                 'order': self._order_counter
             }
             
             result.sources.append(source_info)
-            results_data.append(source_info)
+            self._append_row(results_data, source_info)
             
-    def _extract_block(self, content: str) -> str:
-        """Extract a code block (between { and })."""
+    def _append_row(self, results_data: Dict[str, List], info: Dict) -> None:
+        """Append an element's fields to the column lists."""
+        results_data['filepath'].append(info['filepath'])
+        # Functions aren't nested, so the parent path is a results column
+        # only, not carried by every element's info
+        results_data['parent_path'].append(self._parent_path)
+        results_data['order'].append(info['order'])
+        results_data['name'].append(info['name'])
+        results_data['content'].append(info['content'])
+        results_data['props'].append(info['props'])
+        results_data['processor_type'].append(info['type'])
+            
+    def _extract_block(self, content: str, start: int = 0) -> str:
+        """Extract the code block (between { and }) starting at start."""
+        # Only quotes and braces change the state, so jump between them
+        # instead of stepping through every character
         level = 0
-        in_quotes = False
-        quote_char = None
-        
-        for i, char in enumerate(content):
-            if char in '"\'':
-                if not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif quote_char == char:
-                    in_quotes = False
-            elif not in_quotes:
-                if char == '{':
-                    level += 1
-                elif char == '}':
-                    level -= 1
-                    if level == 0:
-                        return content[:i+1]
-                        
-        return content  # In case we don't find the end
+        pos = start
+        while True:
+            match = _BLOCK_DELIMITER_RE.search(content, pos)
+            if match is None:
+                return content[start:]  # In case we don't find the end
+            pos = match.end()
+            char = match.group()
+            if char == '{':
+                level += 1
+            elif char == '}':
+                level -= 1
+                if level == 0:
+                    return content[start:pos]
+            else:
+                # Braces inside quotes don't count; skip to the closing quote
+                pos = content.find(char, pos) + 1
+                if pos == 0:
+                    return content[start:]
         
-    def _extract_doc_comment(self, content: str) -> str:
-        """Extract documentation comments above an element."""
-        lines = content.split('\n')
+    def _extract_doc_comment(self, content: str, end: Optional[int] = None) -> str:
+        """Extract documentation comments above an element starting at end."""
+        if end is None:
+            end = len(content)
         doc_lines = []
         
-        # Read lines in reverse until we find a non-comment line
-        for line in reversed(lines):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                if line.startswith('#'):
-                    doc_lines.insert(0, line[1:].strip())
-            else:
+        # Read lines in reverse until we find a non-comment line, walking back
+        # from end rather than splitting everything before it
+        while True:
+            line_start = content.rfind('\n', 0, end) + 1
+            line = content[line_start:end].strip()
+            if line and not line.startswith('#'):
+                break
+            if line:
+                doc_lines.append(line[1:].strip())
+            if line_start == 0:
                 break
+            end = line_start - 1
                 
+        doc_lines.reverse()
         return '\n'.join(doc_lines)
         
     def _get_current_path(self) -> str:
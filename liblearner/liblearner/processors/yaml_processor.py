@@ -12,12 +12,18 @@ This processor extracts structured information from YAML files, including:
 """
 
 import re
+import copy
+import json
+import codecs
+import hashlib
 import os
 import logging
 import pandas as pd
-from typing import List, Dict, Any, Set
+from collections import OrderedDict, namedtuple
+from typing import AbstractSet, List, Dict, Any, Tuple
 from pathlib import Path
 import yaml
+from yaml.nodes import MappingNode, ScalarNode
 from yaml.parser import ParserError
 from yaml.scanner import ScannerError
 
@@ -27,13 +33,177 @@ from ..processing_result import YAMLProcessingResult
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# libyaml's C loader when PyYAML was built with it
+_SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Patterns for values found in scalars, compiled once at import time.
+# Env var references and URLs often overlap (${API_URL:-https://...}), so
+# they are found by two scans rather than one alternation that would hide
+# one inside the other.
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+_URL_RE = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:[^\s.,;]*[^\s.,;:])?')
+
+# Shared by every node without env vars or URLs, so most nodes need no sets
+_NO_VALUES = frozenset()
+
+def _decode_yaml(content: bytes) -> str:
+    """Decode YAML bytes as the loaders do: UTF-16 when it has a BOM, else UTF-8, without the BOM."""
+    if content.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return content.decode('utf-16')
+    return content.decode('utf-8-sig')
+
+def _trim_tail(source: str, start: int, end: int) -> int:
+    """Return where source[start:end] ends once trailing blank and comment lines are dropped."""
+    lines = source[start:end].rstrip().split('\n')
+    while len(lines) > 1 and (not lines[-1].strip() or lines[-1].lstrip().startswith('#')):
+        lines.pop()
+    return start + len('\n'.join(lines).rstrip())
+
+def _trim_blank_tail(source: str, start: int, end: int) -> int:
+    """Return where source[start:end] ends once its trailing line break and blank lines are dropped."""
+    text = source[start:end]
+    line_end = text.find('\n', len(text.rstrip()))
+    return end if line_end == -1 else start + line_end
+
+def _load_documents(source: str) -> List[Tuple[Any, Any, Dict]]:
+    """
+    Load every document of source along with its composed node graph.
+    
+    Each document comes as (data, node, objects), objects mapping every
+    node to the value constructed from it, so entries can be matched to
+    the nodes whose marks locate them in the source.
+    """
+    documents = []
+    loader = _SafeLoader(source)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            # Construction fills this dict, then starts a new one
+            objects = loader.constructed_objects
+            documents.append((loader.construct_document(node), node, objects))
+    finally:
+        loader.dispose()
+    return documents
+
+def _load_source(content: bytes) -> Tuple[str, List[Tuple[Any, Any, Dict]], Dict]:
+    """Return (source, documents, source ends) for the bytes of a YAML file."""
+    # Row content is sliced from the source by node marks, which count
+    # characters of the decoded text, so the loader reads it. Line endings
+    # are normalized as text mode would
+    source = _decode_yaml(content)
+    if '\r' in source:
+        source = source.replace('\r\n', '\n').replace('\r', '\n')
+    return source, _load_documents(source), {}
+
+ParseCacheInfo = namedtuple('ParseCacheInfo', 'hits misses max_bytes currbytes currsize')
+
+# Estimated memory a loaded file holds per byte of its source: its composed
+# node graph with marks, the map of constructed objects and the source-end
+# memo, measured at 50-90 times the source for service-definition files
+_RETAINED_PER_BYTE = 100
+
+class _ParseCache:
+    """
+    Least recently used cache of loaded YAML, keyed by a digest of the file's bytes.
+    
+    Files seen again, under the same path or another (re-crawled configs,
+    sub-charts vendored in several places), skip decoding and parsing. An
+    entry holds the source, its documents and the memo of where their
+    nodes end. The cache is bounded by the estimated memory its entries
+    hold, _RETAINED_PER_BYTE per byte of source; a file whose estimate is
+    over the whole budget is never cached. Cached data must not be
+    changed, so processors hand out copies of it.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def load(self, content: bytes) -> Tuple[Tuple[str, List[Tuple[Any, Any, Dict]], Dict], bool]:
+        """
+        Return (source, documents, source ends) for content, loading it on a
+        miss, and whether the cache holds them.
+        """
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        cached = self._entries.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return cached[1], True
+        self.misses += 1
+        entry = _load_source(content)
+        size = len(content) * _RETAINED_PER_BYTE
+        if size > self.max_bytes:
+            return entry, False
+        self._entries[key] = (size, entry)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            evicted_size, _ = self._entries.popitem(last=False)[1]
+            self._bytes -= evicted_size
+        return entry, True
+    
+    def info(self) -> ParseCacheInfo:
+        return ParseCacheInfo(self.hits, self.misses, self.max_bytes, self._bytes, len(self._entries))
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = self.misses = 0
+
+# 8 MiB of loaded YAML, from about 80 KiB of source
+_parse_cache = _ParseCache(max_bytes=8 * 1024 * 1024)
+
+def parse_cache_info() -> ParseCacheInfo:
+    """Return hit and miss counts and the estimated bytes and files held by the YAML parse cache."""
+    return _parse_cache.info()
+
+def parse_cache_clear() -> None:
+    """Empty the YAML parse cache and reset its counts."""
+    _parse_cache.clear()
+
+def _json_keys(data: Any) -> Any:
+    """Return data with every mapping key JSON can't hold, like dates, as a string."""
+    if type(data) is dict:
+        return {key if key is None or isinstance(key, (str, int, float)) else str(key): _json_keys(value)
+                for key, value in data.items()}
+    if type(data) is list:
+        return [_json_keys(item) for item in data]
+    return data
+
+def _json_props(props: Dict[str, Any]) -> str:
+    """Serialize row props as JSON, writing values JSON has no type for as strings."""
+    try:
+        return json.dumps(props, default=str)
+    except TypeError:
+        # YAML mapping keys may be dates and other non-JSON types
+        return json.dumps(_json_keys(props), default=str)
+
+# Columns of the results DataFrame, in order
+_COLUMNS = ('filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type')
+
+def _new_columns() -> Dict[str, List]:
+    """Return empty per-column lists for results rows."""
+    return {column: [] for column in _COLUMNS}
+
 class YAMLProcessor(FileProcessor):
     """Processor for YAML files."""
     
-    def __init__(self, debug: bool = False):
-        """Initialize the YAML processor."""
+    def __init__(self, debug: bool = False, use_parse_cache: bool = False):
+        """
+        Initialize the YAML processor.
+        
+        Args:
+            debug: Log progress while processing
+            use_parse_cache: Reuse loaded YAML for files whose bytes were
+                seen before, from the parse cache shared by all processors.
+                Only worth it when the same files are processed repeatedly
+        """
         super().__init__()
         self.debug = debug
+        self.use_parse_cache = use_parse_cache
         if self.debug:
             logger.setLevel(logging.DEBUG)
         else:
@@ -51,12 +221,40 @@ class YAMLProcessor(FileProcessor):
         }
         
         # Initialize patterns
-        self.env_var_pattern = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
-        self.url_pattern = re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:[^\s.,;]*[^\s.,;:])?')
+        self.env_var_pattern = _ENV_VAR_RE
+        self.url_pattern = _URL_RE
         
         # Initialize tracking variables
         self._order_counter = 0
         self._current_path = []
+        
+        # Source of the file being processed and where its nodes end, and
+        # whether its documents are held by the parse cache
+        self._source = ''
+        self._source_ends = {}
+        self._documents_cached = False
+
+    @property
+    def results_df(self) -> pd.DataFrame:
+        """Combined results of every processed file."""
+        return self.flush()
+    
+    @results_df.setter
+    def results_df(self, df: pd.DataFrame) -> None:
+        self._results_df = df
+        self._row_buffer = _new_columns()
+        
+    def flush(self) -> pd.DataFrame:
+        """Add the rows buffered since the last flush to results_df in one batch."""
+        if self._row_buffer['order']:
+            # Rows are staged as one list per column, already in column order
+            df = pd.DataFrame(self._row_buffer, copy=False)
+            if not self._results_df.empty:
+                self._results_df = pd.concat([self._results_df, df], ignore_index=True)
+            else:
+                self._results_df = df
+            self._row_buffer = _new_columns()
+        return self._results_df
 
     def get_supported_types(self) -> List[str]:
         """Return list of supported MIME types."""
@@ -73,45 +271,45 @@ class YAMLProcessor(FileProcessor):
         
         path = Path(file_path)
         result = YAMLProcessingResult()
-        results_data = []
+        results_data = _new_columns()
 
-        # Validate file exists
-        if not path.exists():
+        # A single stat both checks existence and supplies file_info
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             error_msg = f"Error reading file: File not found - {file_path}"
             result.errors.append(error_msg)
             logger.error(error_msg)
             return result
 
-        try:
-            # Add file metadata
-            result.file_info = {
-                'name': path.name,
-                'path': str(path.absolute()),
-                'size': path.stat().st_size,
-                'last_modified': path.stat().st_mtime
-            }
-        except Exception as e:
-            error_msg = f"Error getting file info: {str(e)}"
-            result.errors.append(error_msg)
-            logger.error(error_msg)
-            return result
+        # Add file metadata
+        result.file_info = {
+            'name': path.name,
+            'path': str(path.absolute()),
+            'size': stat.st_size,
+            'last_modified': stat.st_mtime
+        }
 
         try:
-            content = path.read_text()
+            content = path.read_bytes()
             if self.debug:
                 logger.debug(f"Read file content, size: {len(content)} bytes")
             
-            # Parse YAML content
-            documents = list(yaml.safe_load_all(content))
+            # Parse YAML content, or reuse it when these bytes were seen before
+            if self.use_parse_cache:
+                entry, self._documents_cached = _parse_cache.load(content)
+            else:
+                entry, self._documents_cached = _load_source(content), False
+            self._source, documents, self._source_ends = entry
             if self.debug:
                 logger.info(f"Found {len(documents)} YAML documents")
             
             # Process each document
-            for doc_idx, doc in enumerate(documents):
+            for doc_idx, (doc, node, objects) in enumerate(documents):
                 if doc:  # Skip empty documents
                     if self.debug:
                         logger.debug(f"Processing document {doc_idx}")
-                    self._process_document(doc, doc_idx, result, results_data, file_path)
+                    self._process_document(doc, doc_idx, result, results_data, node, objects)
             
         except (ParserError, ScannerError) as e:
             error_msg = f"YAML parsing error: {str(e)}"
@@ -124,168 +322,257 @@ class YAMLProcessor(FileProcessor):
             logger.error(error_msg)
             return result
 
-        # Create DataFrame from results
-        if results_data:
-            try:
-                df = pd.DataFrame(results_data)
-                df = df.rename(columns={'type': 'processor_type'})
-                column_order = ['filepath', 'parent_path', 'order', 'name', 
-                              'content', 'props', 'processor_type']
-                df = df[column_order]
-                
-                # Concatenate with existing results
-                if not self.results_df.empty:
-                    self.results_df = pd.concat([self.results_df, df], ignore_index=True)
-                else:
-                    self.results_df = df
-            except Exception as e:
-                error_msg = f"Error creating DataFrame: {str(e)}"
-                result.errors.append(error_msg)
-                logger.error(error_msg)
+        # Rows are buffered and turned into a DataFrame once on flush()
+        # instead of rebuilding the combined results after every file
+        results_data['filepath'] = [file_path] * len(results_data['order'])
+        for column, values in results_data.items():
+            self._row_buffer[column].extend(values)
 
         return result
         
     def _process_document(self, doc: Dict, doc_idx: int, result: YAMLProcessingResult,
-                         results_data: List[Dict], file_path: str) -> None:
+                          results_data: Dict[str, List], node: Any, objects: Dict) -> None:
         """Process a single YAML document."""
         self._order_counter += 1
         
-        # Store document in result
-        result.data[f'doc_{doc_idx}'] = doc
+        # Store document in result. Cached data is shared with later hits
+        # and read again for their rows, so callers get their own copy
+        result.data[f'doc_{doc_idx}'] = copy.deepcopy(doc) if self._documents_cached else doc
+        
+        # Env vars, URLs and structure of every node, from a single walk
+        summaries = {}
+        env_vars, urls, structure = self._summarize(doc, summaries)
         
         # Create document info
         doc_name = f"document_{doc_idx}"
         doc_props = {
-            'env_vars': list(self._extract_env_vars(doc)),
-            'urls': list(self._extract_urls(doc)),
-            'structure': self._analyze_structure(doc)
+            'env_vars': list(env_vars),
+            'urls': list(urls),
+            'structure': structure
         }
         
-        # Create document entry
-        doc_info = {
-            'name': doc_name,
-            'type': 'document',
-            'content': yaml.dump(doc),
-            'props': str(doc_props),
-            'filepath': file_path,
-            'parent_path': '',  # Documents are top-level
-            'order': self._order_counter
-        }
-        results_data.append(doc_info)
+        # Create document entry; documents are top-level
+        self._append_row(results_data, 'document', doc_name, self._node_source(node), _json_props(doc_props), '')
         
         # Process document contents
-        if isinstance(doc, dict):
-            self._process_mapping(doc, doc_name, results_data, file_path)
-        elif isinstance(doc, list):
-            self._process_sequence(doc, doc_name, results_data, file_path)
+        self._process_entries(doc, node, objects, doc_name, results_data, summaries)
             
-    def _process_mapping(self, data: Dict, parent_path: str,
-                        results_data: List[Dict], file_path: str) -> None:
-        """Process a YAML mapping node."""
-        for key, value in data.items():
+    def _process_entries(self, doc: Any, node: Any, objects: Dict, doc_name: str,
+                         results_data: Dict[str, List], summaries: Dict[int, Tuple]) -> None:
+        """
+        Process the mapping and sequence entries of a document, in document order.
+        
+        Entries are taken from an explicit stack rather than by recursion, so
+        deeply nested documents cost no Python frames. Once an entry is
+        recorded its own entries are pushed, last first, keeping the
+        depth-first order and numbering of a recursive walk.
+        """
+        source = self._source
+        stack = []
+        self._push_entries(stack, doc, node, objects, doc_name)
+        while stack:
+            parent_path, key, value, key_node, value_node = stack.pop()
             self._order_counter += 1
-            current_path = f"{parent_path}.{key}" if parent_path else key
+            env_vars, urls, _ = summaries[id(value)]
+            value_type = type(value)
             
-            # Create mapping entry
-            props = {
-                'key': key,
-                'value_type': type(value).__name__,
-                'env_vars': list(self._extract_env_vars(value)),
-                'urls': list(self._extract_urls(value))
-            }
+            if key_node is None:
+                # Create sequence entry
+                props = {
+                    'index': key,
+                    'value_type': value_type.__name__,
+                    'env_vars': list(env_vars),
+                    'urls': list(urls)
+                }
+                self._append_row(results_data, 'sequence', f"item_{key}",
+                                 self._node_source(value_node), _json_props(props), parent_path)
+            else:
+                # Create mapping entry, from its key to the end of its value.
+                # An alias value's node lies before the key, so its own
+                # source is written after the key's
+                start = key_node.start_mark.index
+                if value_node.start_mark.index >= key_node.end_mark.index:
+                    content = source[start:self._source_end(value_node)]
+                else:
+                    content = f"{source[start:key_node.end_mark.index]}: {self._node_source(value_node)}"
+                props = {
+                    'key': key,
+                    'value_type': value_type.__name__,
+                    'env_vars': list(env_vars),
+                    'urls': list(urls)
+                }
+                self._append_row(results_data, 'mapping', key, content, _json_props(props), parent_path)
             
-            mapping_info = {
-                'name': key,
-                'type': 'mapping',
-                'content': yaml.dump({key: value}),
-                'props': str(props),
-                'filepath': file_path,
-                'parent_path': parent_path,
-                'order': self._order_counter
-            }
-            results_data.append(mapping_info)
+            # Process nested structures. The path of an entry is only built
+            # for collections, once, and shared by all of their entries
+            if value_type is dict or value_type is list:
+                if key_node is None:
+                    current_path = f"{parent_path}[{key}]"
+                else:
+                    current_path = f"{parent_path}.{key}" if parent_path else key
+                self._push_entries(stack, value, value_node, objects, current_path)
+    
+    def _append_row(self, results_data: Dict[str, List], row_type: str, name: Any,
+                    content: str, props: str, parent_path: str) -> None:
+        """Append one row at the current order; filepath is filled in per file."""
+        results_data['parent_path'].append(parent_path)
+        results_data['order'].append(self._order_counter)
+        results_data['name'].append(name)
+        results_data['content'].append(content)
+        results_data['props'].append(props)
+        results_data['processor_type'].append(row_type)
+    
+    def _push_entries(self, stack: List[Tuple], data: Any, node: Any, objects: Dict, path: str) -> None:
+        """
+        Push the entries of a mapping or sequence node at path, first entry on top.
+        
+        Entries come as (path, key, value, key_node, value_node), key_node
+        being None in sequences. A mapping's pairs are those left after
+        merge keys were applied; a repeated key keeps its first position
+        and last value, as in the loaded dict.
+        """
+        data_type = type(data)
+        if data_type is dict:
+            pairs = {}
+            for key_node, value_node in node.value:
+                pairs[objects[key_node]] = (key_node, value_node)
+            stack.extend(reversed([(path, key, objects[value_node], key_node, value_node)
+                                   for key, (key_node, value_node) in pairs.items()]))
+        elif data_type is list:
+            stack.extend(reversed([(path, idx, item, None, item_node)
+                                   for idx, (item, item_node) in enumerate(zip(data, node.value))]))
+    
+    def _node_source(self, node: Any) -> str:
+        """Return the source text of a node."""
+        return self._source[node.start_mark.index:self._source_end(node)]
+    
+    def _source_end(self, node: Any) -> int:
+        """
+        Return where the source of a node ends.
+        
+        Scalars and flow collections end at their end mark, except block
+        scalars, whose end mark comes after their trailing blank lines. A block
+        collection only ends where the next token starts, past any comments
+        in between, so it ends with its last value instead; when that value
+        is an alias, whose node lies earlier, its trailing blank and comment
+        lines are trimmed instead.
+        """
+        ends = self._source_ends
+        chain = []
+        while True:
+            end = ends.get(node)
+            if end is not None:
+                break
+            if type(node) is ScalarNode and node.style in ('|', '>'):
+                end = _trim_blank_tail(self._source, node.start_mark.index, node.end_mark.index)
+                break
+            if type(node) is ScalarNode or node.flow_style or not node.value:
+                end = node.end_mark.index
+                break
+            chain.append(node)
+            if type(node) is MappingNode:
+                key_node, last = node.value[-1]
+                # Pairs taken from a merge key lie before the mapping
+                boundary = (key_node.end_mark.index
+                            if key_node.start_mark.index >= node.start_mark.index else None)
+            else:
+                last = node.value[-1]
+                boundary = node.value[-2].end_mark.index if len(node.value) > 1 else node.start_mark.index
+            if boundary is None or last.start_mark.index < boundary:
+                end = _trim_tail(self._source, node.start_mark.index, node.end_mark.index)
+                break
+            node = last
+        for chained in chain:
+            ends[chained] = end
+        ends[node] = end
+        return end
+    
+    def _summarize(self, data: Any, summaries: Dict[int, Tuple]
+                   ) -> Tuple[AbstractSet[str], AbstractSet[str], Dict]:
+        """
+        Return the environment variables, URLs and structure of a YAML node.
+        
+        Each node is visited once: a collection's summary is built from its
+        children's, and every node's summary is stored in summaries, keyed by
+        id, so entries for nested nodes can reuse it instead of walking their
+        subtree again. The walk uses an explicit stack rather than recursion;
+        a collection is summarized when it comes back up the stack after all
+        of its children.
+        
+        Nodes of the same shape share one structure dict, and nodes without
+        env vars or URLs share an empty set, so the summaries hold few
+        containers beyond the nested structure itself. Shapes are keyed by
+        the keys of a mapping and the identity of its children's structures,
+        which are shared in turn, so repeated objects (list items, services)
+        build their structure once.
+        """
+        str_structure = {'type': 'str'}
+        leaf_structures = {}
+        shape_structures = {}
+        stack = [(data, False)]
+        pending = set()  # Collections waiting for their children
+        while stack:
+            node, children_done = stack.pop()
+            node_id = id(node)
+            if node_id in summaries:
+                continue
             
-            # Process nested structures
-            if isinstance(value, dict):
-                self._process_mapping(value, current_path, results_data, file_path)
-            elif isinstance(value, list):
-                self._process_sequence(value, current_path, results_data, file_path)
+            # The safe loaders build plain dicts and lists, never subclasses,
+            # so an identity check on the type replaces isinstance. Strings,
+            # the most common nodes, are tested for first.
+            node_type = type(node)
+            if node_type is str:
+                env_vars = urls = _NO_VALUES
+                # Substring checks skip the regex scans for the many strings
+                # that can't hold a reference or a URL
+                if '$' in node:
+                    # findall yields (braced, plain) pairs without Match objects;
+                    # only the variable name before any default value is kept
+                    env_vars = {(braced or plain).split(':-')[0]
+                                for braced, plain in self.env_var_pattern.findall(node)}
+                if '://' in node:
+                    urls = set(self.url_pattern.findall(node))
+                structure = str_structure
+            elif node_type is not dict and node_type is not list:
+                env_vars = urls = _NO_VALUES
+                type_name = node_type.__name__
+                structure = leaf_structures.get(type_name)
+                if structure is None:
+                    structure = leaf_structures[type_name] = {'type': type_name}
+            else:
+                children = node.values() if node_type is dict else node
+                if not children_done:
+                    if node_id in pending:
+                        raise ValueError("Recursive YAML aliases are not supported")
+                    pending.add(node_id)
+                    stack.append((node, True))
+                    stack.extend((child, False) for child in children)
+                    continue
+                pending.discard(node_id)
                 
-    def _process_sequence(self, data: List, parent_path: str,
-                         results_data: List[Dict], file_path: str) -> None:
-        """Process a YAML sequence node."""
-        for idx, item in enumerate(data):
-            self._order_counter += 1
-            current_path = f"{parent_path}[{idx}]"
-            
-            # Create sequence entry
-            props = {
-                'index': idx,
-                'value_type': type(item).__name__,
-                'env_vars': list(self._extract_env_vars(item)),
-                'urls': list(self._extract_urls(item))
-            }
-            
-            sequence_info = {
-                'name': f"item_{idx}",
-                'type': 'sequence',
-                'content': yaml.dump([item]),
-                'props': str(props),
-                'filepath': file_path,
-                'parent_path': parent_path,
-                'order': self._order_counter
-            }
-            results_data.append(sequence_info)
+                env_vars = set()
+                urls = set()
+                child_structures = []
+                for child in children:
+                    child_env_vars, child_urls, child_structure = summaries[id(child)]
+                    env_vars.update(child_env_vars)
+                    urls.update(child_urls)
+                    child_structures.append(child_structure)
+                child_ids = tuple(map(id, child_structures))
+                if node_type is dict:
+                    # Key types are part of the shape since 1 == True == 1.0
+                    shape = (tuple(node), tuple(map(type, node)), child_ids)
+                else:
+                    shape = child_ids
+                structure = shape_structures.get(shape)
+                if structure is None:
+                    if node_type is dict:
+                        structure = {'type': 'mapping', 'keys': dict(zip(node, child_structures))}
+                    else:
+                        structure = {'type': 'sequence', 'items': child_structures}
+                    shape_structures[shape] = structure
+                env_vars = env_vars or _NO_VALUES
+                urls = urls or _NO_VALUES
             
-            # Process nested structures
-            if isinstance(item, dict):
-                self._process_mapping(item, current_path, results_data, file_path)
-            elif isinstance(item, list):
-                self._process_sequence(item, current_path, results_data, file_path)
-                
-    def _analyze_structure(self, data: Any) -> Dict:
-        """Analyze the structure of a YAML node."""
-        if isinstance(data, dict):
-            return {
-                'type': 'mapping',
-                'keys': {k: self._analyze_structure(v) for k, v in data.items()}
-            }
-        elif isinstance(data, list):
-            return {
-                'type': 'sequence',
-                'items': [self._analyze_structure(item) for item in data]
-            }
-        else:
-            return {'type': type(data).__name__}
-
-    def _extract_env_vars(self, data: Any) -> Set[str]:
-        """Extract environment variables from YAML content."""
-        env_vars = set()
-        if isinstance(data, str):
-            matches = self.env_var_pattern.findall(data)
-            for match in matches:
-                var_name = match[0] or match[1]
-                # Extract just the variable name before any default value
-                var_name = var_name.split(':-')[0] if ':-' in var_name else var_name
-                env_vars.add(var_name)
-        elif isinstance(data, dict):
-            for value in data.values():
-                env_vars.update(self._extract_env_vars(value))
-        elif isinstance(data, list):
-            for item in data:
-                env_vars.update(self._extract_env_vars(item))
-        return env_vars
-
-    def _extract_urls(self, data: Any) -> Set[str]:
-        """Extract URLs from YAML content."""
-        urls = set()
-        if isinstance(data, str):
-            matches = self.url_pattern.findall(data)
-            urls.update(matches)
-        elif isinstance(data, dict):
-            for value in data.values():
-                urls.update(self._extract_urls(value))
-        elif isinstance(data, list):
-            for item in data:
-                urls.update(self._extract_urls(item))
-        return urls
+            summaries[node_id] = (env_vars, urls, structure)
+        return summaries[id(data)]
@@ -3,11 +3,17 @@
 import ast
 import csv
 import os
-from collections import defaultdict
-import astunparse
+from collections import defaultdict, namedtuple
+from itertools import accumulate
 
-class PythonExtractor(ast.NodeVisitor):
-    def __init__(self, filename, globals_only=False):
+from . import _result_cache
+
+# One extracted function, method or lambda. Records stay plain tuples in
+# memory and in the CSV, with the fields also reachable by name.
+FunctionRecord = namedtuple('FunctionRecord', 'file class_ order name parameters docstring code')
+
+class PythonExtractor:
+    def __init__(self, filename, globals_only=False, source_code=''):
         self.functions = []
         self.current_class = None
         self.current_function = []
@@ -15,19 +21,68 @@ class PythonExtractor(ast.NodeVisitor):
         self.lambda_count = 0
         self.filename = filename
         self.globals_only = globals_only
+        # source_code may also be assigned after construction; it is indexed
+        # when visited
+        self.source_code = source_code
+        self._indexed_source = None
+        self._source = b''
+        self._line_offsets = [0]
 
-    def visit_FunctionDef(self, node):
-        self._process_entity(node, entity_type='function')
+    def visit(self, node):
+        """
+        Extract the functions, methods and lambdas in node and everything below it.
+        
+        Nodes are visited in source order from an explicit stack rather than by
+        recursion. Entering a class or function pushes the callback that closes
+        its scope underneath its children, so it runs once they are done.
+        """
+        if self._indexed_source is not self.source_code:
+            self._index_source()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if not isinstance(node, ast.AST):
+                node()
+                continue
+            
+            node_type = type(node)
+            if node_type is ast.ClassDef:
+                self.current_class = node.name
+                stack.append(self._leave_class)
+            elif node_type is ast.FunctionDef:
+                if not self._process_entity(node, entity_type='function'):
+                    continue
+                stack.append(self.current_function.pop)
+            elif node_type is ast.Lambda:
+                if not self._process_entity(node, entity_type='lambda'):
+                    continue
+                stack.append(self.current_function.pop)
+            stack.extend(reversed(list(ast.iter_child_nodes(node))))
 
-    def visit_ClassDef(self, node):
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = None
+    def _index_source(self):
+        """Encode source_code and find the byte offset of each line."""
+        # AST column offsets count UTF-8 bytes, so code is sliced from the
+        # encoded source, starting from the offset of each line
+        self._indexed_source = self.source_code
+        self._source = self.source_code.encode('utf-8')
+        self._line_offsets = [0, *accumulate(map(len, self._source.splitlines(keepends=True)))]
+
+    def _get_source(self, node):
+        """Return the source text of a node, including any decorators."""
+        start_line = node.lineno
+        decorators = getattr(node, 'decorator_list', None)
+        if decorators:
+            # Decorators sit at the same indentation as the definition
+            start_line = decorators[0].lineno
+        start = self._line_offsets[start_line - 1] + node.col_offset
+        end = self._line_offsets[node.end_lineno - 1] + node.end_col_offset
+        return self._source[start:end].decode('utf-8')
 
-    def visit_Lambda(self, node):
-        self._process_entity(node, entity_type='lambda')
+    def _leave_class(self):
+        self.current_class = None
 
     def _process_entity(self, node, entity_type):
+        """Record a function or lambda; entering its scope if its body is to be visited."""
         self.order += 1
         parent_class = self.current_class or "Global"
         parent_function = self.current_function[-1] if self.current_function else None
@@ -41,13 +96,15 @@ class PythonExtractor(ast.NodeVisitor):
         
         parameters = [arg.arg for arg in node.args.args]
         docstring = ast.get_docstring(node) or "N/A" if entity_type == 'function' else "N/A"
-        entity_code = astunparse.unparse(node)
-        self.functions.append((self.filename, parent_class, self.order, full_entity_name, parameters, docstring, entity_code))
+        entity_code = self._get_source(node)
+        self.functions.append(FunctionRecord(self.filename, parent_class, self.order, full_entity_name,
+                                             parameters, docstring, entity_code))
 
+        # visit closes the scope once the body is done
         if not self.globals_only or (self.globals_only and not parent_function):
             self.current_function.append(entity_name)
-            self.generic_visit(node)
-            self.current_function.pop()
+            return True
+        return False
 
 def extract_functions(source_code, filename, globals_only=False):
     """
@@ -59,15 +116,14 @@ def extract_functions(source_code, filename, globals_only=False):
         globals_only (bool): If True, only extract global functions
         
     Returns:
-        list: List of tuples containing function information
+        list: List of FunctionRecord tuples
     """
     tree = ast.parse(source_code)
-    extractor = PythonExtractor(filename, globals_only)
-    extractor.source_code = source_code
+    extractor = PythonExtractor(filename, globals_only, source_code)
     extractor.visit(tree)
     return extractor.functions
 
-def process_file(file_path, error_callback=None, globals_only=False):
+def process_file(file_path, error_callback=None, globals_only=False, cache_dir=None):
     """
     Process a single Python file and extract its functions.
     
@@ -75,9 +131,11 @@ def process_file(file_path, error_callback=None, globals_only=False):
         file_path (str): Path to the Python file
         error_callback (callable): Optional callback for error handling
         globals_only (bool): If True, only extract global functions
+        cache_dir (str): Optional directory caching extracted functions across runs;
+            unchanged files are then returned without being parsed
         
     Returns:
-        list: List of extracted functions
+        list: List of extracted FunctionRecord tuples
         
     Raises:
         SyntaxError: If the Python code is invalid
@@ -86,17 +144,58 @@ def process_file(file_path, error_callback=None, globals_only=False):
     try:
         with open(file_path, 'r') as f:
             source_code = f.read()
+        key = None
+        if cache_dir is not None:
+            key = _result_cache.cache_key(f'python_extractor:{globals_only}', file_path,
+                                          source_code.encode('utf-8'))
+            cached = _result_cache.load(cache_dir, key)
+            if cached is not None:
+                return cached
         tree = ast.parse(source_code)  # Let syntax errors propagate
-        extractor = PythonExtractor(file_path, globals_only)
-        extractor.source_code = source_code
+        extractor = PythonExtractor(file_path, globals_only, source_code)
         extractor.visit(tree)
+        if key is not None:
+            _result_cache.store(cache_dir, key, extractor.functions)
         return extractor.functions
     except Exception as e:
         if error_callback:
             error_callback(file_path, str(e))
         raise  # Re-raise the exception to be handled by the processor
 
-def process_directory(input_directory, ignore_dirs=None, error_callback=None, progress_callback=None, globals_only=False):
+def _find_python_files(input_directory, ignore_dirs):
+    """
+    Return (folder, path) for every Python file below input_directory, in os.walk order.
+    
+    Directories are listed with os.scandir, whose entries know their type
+    without a stat per file, from an explicit stack. As with os.walk,
+    ignored and symlinked directories are not entered and unreadable
+    directories are skipped.
+    """
+    python_files = []
+    stack = [input_directory]
+    while stack:
+        root = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if entry.name not in ignore_dirs and not entry.is_symlink():
+                            subdirs.append(os.path.join(root, entry.name))
+                    elif entry.name.endswith(".py"):
+                        python_files.append((root, os.path.join(root, entry.name)))
+        except OSError:
+            continue
+        # Subdirectories are walked in listing order, after the files above them
+        stack.extend(reversed(subdirs))
+    return python_files
+
+def process_directory(input_directory, ignore_dirs=None, error_callback=None, progress_callback=None, globals_only=False,
+                      cache_dir=None):
     """
     Process a directory recursively and extract functions from all Python files.
     
@@ -106,6 +205,7 @@ def process_directory(input_directory, ignore_dirs=None, error_callback=None, pr
         error_callback (callable): Optional callback for error handling
         progress_callback (callable): Optional callback for progress updates
         globals_only (bool): If True, only extract global functions
+        cache_dir (str): Optional directory caching extracted functions across runs
         
     Returns:
         dict: Dictionary mapping folders to their extracted functions
@@ -114,22 +214,16 @@ def process_directory(input_directory, ignore_dirs=None, error_callback=None, pr
         ignore_dirs = ["venv", ".git", 'ds_venv', 'dw_env']
         
     folder_to_functions = defaultdict(list)
-    total_files = sum(1 for root, dirs, files in os.walk(input_directory)
-                     if not any(d in root for d in ignore_dirs)
-                     for file in files if file.endswith(".py"))
-    processed_files = 0
+    # The tree is walked once; the files found give the progress total
+    python_files = _find_python_files(input_directory, frozenset(ignore_dirs))
+    total_files = len(python_files)
     
-    for root, dirs, files in os.walk(input_directory):
-        dirs[:] = [d for d in dirs if d not in ignore_dirs]
-        for file in files:
-            if file.endswith(".py"):
-                file_path = os.path.join(root, file)
-                relative_folder = os.path.relpath(root, input_directory)
-                functions = process_file(file_path, error_callback, globals_only)
-                folder_to_functions[relative_folder].extend(functions)
-                processed_files += 1
-                if progress_callback:
-                    progress_callback(processed_files, total_files, file_path)
+    for processed_files, (root, file_path) in enumerate(python_files, 1):
+        relative_folder = os.path.relpath(root, input_directory)
+        functions = process_file(file_path, error_callback, globals_only, cache_dir)
+        folder_to_functions[relative_folder].extend(functions)
+        if progress_callback:
+            progress_callback(processed_files, total_files, file_path)
                     
     return dict(folder_to_functions)
 
@@ -138,7 +232,7 @@ def write_results_to_csv(functions, output_path):
     Write extracted functions to a CSV file.
     
     Args:
-        functions (list): List of function information tuples
+        functions (list): List of FunctionRecord tuples
         output_path (str): Path to the output CSV file
     """
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -22,18 +22,20 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     install_requires=[
-        "astunparse>=1.6.3",
         "python-magic>=0.4.27",
         "pandas",
         "typing",
         "pathlib",
         "nbformat>=5.0.0",  # For Jupyter notebook processing
     ],
+    extras_require={
+        "fast": [
+            "hyperscan",  # Single-pass markdown prefilter
+        ],
+    },
 )
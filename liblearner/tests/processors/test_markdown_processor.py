@@ -140,6 +140,25 @@ no language specified
     assert "def hello" in python_block["content"]
     assert "print" in python_block["content"]
 
+def test_indented_code_block_closes(markdown_processor, create_temp_md):
+    """Test an indented fence, as in a list item, closes and later blocks are found."""
+    md_file = create_temp_md("- item\n   ```python\nx\n   ```\n# After\n- another")
+    
+    df = markdown_processor.process_file(str(md_file)).to_dataframe()
+    assert df[df["processor_type"] == "code_block"]["content"].tolist() == ["x"]
+    assert df[df["processor_type"] == "header"]["content"].tolist() == ["After"]
+    assert df[df["processor_type"] == "list_item"]["content"].tolist() == ["item", "another"]
+
+def test_crlf_line_endings(markdown_processor, tmp_path):
+    """Test CRLF files are read with normalized line endings, as in text mode."""
+    md_file = tmp_path / "crlf.md"
+    md_file.write_bytes(b"# Title\r\n```python\r\nx = 1\r\n```\r\n| a | b |\r\n|---|---|\r\n| 1 | 2 |\r\n# After\r\n")
+    
+    df = markdown_processor.process_file(str(md_file)).to_dataframe()
+    assert df[df["processor_type"] == "header"]["content"].tolist() == ["Title", "After"]
+    assert df[df["processor_type"] == "code_block"]["content"].tolist() == ["x = 1"]
+    assert (df["processor_type"] == "table_row").any()
+
 def test_markdown_lists(markdown_processor, create_temp_md):
     """Test processing of ordered and unordered lists with nested items."""
     content = """- Item 1
@@ -354,4 +373,88 @@ def test():
     
     # Check element relationships
     assert df["parent_path"].notna().all()
-    assert df["order"].is_monotonic_increasing
\ No newline at end of file
+    assert df["order"].is_monotonic_increasing
+
+
+def test_prefilter_scan_without_hyperscan(monkeypatch):
+    """Test the structural character prefilter used when hyperscan is not installed."""
+    from liblearner.processors import markdown_processor as module
+    monkeypatch.setattr(module, "hyperscan", None)
+    monkeypatch.setattr(module, "_hs_database", None)
+    present = module._scan_present("# Title\n\n| a |\n")
+    assert {"headers", "tables"} <= present
+    assert "code_blocks" not in present
+    assert module._scan_present("plain text only") == set()
+
+
+def test_plain_text_file_skips_extraction(markdown_processor, tmp_path, monkeypatch):
+    """Test a file without markdown structure yields an empty result."""
+    from liblearner.processors import markdown_processor as module
+    monkeypatch.setattr(module, "hyperscan", None)
+    monkeypatch.setattr(module, "_hs_database", None)
+    md_file = tmp_path / "plain.md"
+    md_file.write_text("just some words\nand another line\n")
+    result = markdown_processor.process_file(str(md_file))
+    assert result.df.empty
+
+
+def test_prefilter_scan_with_hyperscan():
+    """Test the hyperscan prefilter reports only the element kinds present."""
+    pytest.importorskip("hyperscan")
+    from liblearner.processors import markdown_processor as module
+    present = module._scan_present("# Title\n\n- item\n")
+    assert {"headers", "lists"} <= present
+    assert "code_blocks" not in present
+    assert module._scan_present("plain text only") == set()
+
+
+def test_results_are_flushed_in_batches(markdown_processor, tmp_path):
+    """Test combined results are built once on flush rather than per file."""
+    for idx in range(3):
+        md_file = tmp_path / f"file{idx}.md"
+        md_file.write_text(f"# File {idx}\n- item {idx}\n")
+        markdown_processor.process_file(str(md_file))
+    
+    # Nothing is concatenated until the results are requested
+    assert markdown_processor._results_df.empty
+    df = markdown_processor.flush()
+    assert len(df) == 6
+    # Text columns stay plain strings, so groupby only sees present values
+    assert pd.api.types.is_string_dtype(df['filepath'])
+    assert pd.api.types.is_string_dtype(df['processor_type'])
+    assert df.groupby('processor_type').size().to_dict() == {'header': 3, 'list_item': 3}
+    assert markdown_processor.results_df is df
+
+
+def test_unchanged_file_is_served_from_cache(markdown_processor, create_temp_md):
+    """Test unchanged files reuse their result and changed files are reparsed."""
+    md_file = create_temp_md("# Cached\n")
+    first = markdown_processor.process_file(str(md_file))
+    hit = markdown_processor.process_file(str(md_file))
+    # Hits are copies, so changing one result leaves later hits intact
+    assert hit is not first and hit.df.equals(first.df)
+    hit.metadata['changed'] = True
+    hit.df.loc[0, 'content'] = 'Changed'
+    again = markdown_processor.process_file(str(md_file))
+    assert 'changed' not in again.metadata
+    assert list(again.df['content']) == ['Cached']
+    # Cached files still contribute their rows to the combined results
+    assert len(markdown_processor.results_df) == 3
+    
+    md_file.write_text("# Changed\n- item\n")
+    second = markdown_processor.process_file(str(md_file))
+    assert second is not first
+    assert list(second.df['content']) == ['Changed', 'item']
+
+
+def test_cache_keeps_a_bounded_number_of_files(markdown_processor, tmp_path):
+    """Test the least recently used files are evicted once the cache is full."""
+    markdown_processor._cache.maxsize = 2
+    paths = []
+    for idx in range(3):
+        md_file = tmp_path / f"file{idx}.md"
+        md_file.write_text(f"# File {idx}\n")
+        paths.append(str(md_file))
+        markdown_processor.process_file(paths[-1])
+    assert len(markdown_processor._cache) == 2
+    assert markdown_processor._cache.get(paths[0], None) is None
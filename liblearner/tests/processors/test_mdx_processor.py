@@ -0,0 +1,140 @@
+import pytest
+import pandas as pd
+from pathlib import Path
+from liblearner.processors.mdx_processor import MDXProcessor
+
+TEST_FILES_DIR = Path(__file__).parent.parent / "test_files"
+
+@pytest.fixture
+def mdx_processor():
+    return MDXProcessor(debug=True)
+
+@pytest.fixture
+def create_temp_mdx(tmp_path):
+    def _create_temp_mdx(content: str) -> Path:
+        mdx_file = tmp_path / "test.mdx"
+        mdx_file.write_text(content)
+        return mdx_file
+    return _create_temp_mdx
+
+def test_process_example_mdx(mdx_processor):
+    """Test processing the example MDX file."""
+    result = mdx_processor.process_file(str(TEST_FILES_DIR / "example.mdx"))
+    assert result is not None
+    
+    # Imports and frontmatter come from the whole file, not the last component
+    sources = [imp["source"] for imp in result["imports"]]
+    assert "@/components/ui/button" in sources
+    assert "@/components/ui/card" in sources
+    assert result["frontmatter"]["title"] == "Example MDX"
+    
+    names = [comp["name"] for comp in result["components"]]
+    assert "Button" in names
+    assert "Card" in names
+    
+    df = mdx_processor.get_results_dataframe()
+    assert isinstance(df, pd.DataFrame)
+    assert set(df["type"]) == {"component", "import", "frontmatter"}
+
+def test_component_content_does_not_shadow_file(mdx_processor, create_temp_mdx):
+    """Test component bodies do not replace the content scanned for imports."""
+    mdx_file = create_temp_mdx("""---
+title: Shadowing
+---
+
+import { Chart } from './chart'
+
+<Chart kind="bar">
+  inner text
+</Chart>
+""")
+    result = mdx_processor.process_file(str(mdx_file))
+    assert result["frontmatter"] == {"title": "Shadowing"}
+    assert result["imports"] == [{"items": "Chart ", "source": "./chart"}]
+    assert result["components"][0]["props"] == {"kind": "bar"}
+    assert "inner text" in result["components"][0]["content"]
+
+def test_crlf_line_endings(mdx_processor, tmp_path):
+    """Test CRLF files are read with normalized line endings, as in text mode."""
+    mdx_file = tmp_path / "crlf.mdx"
+    mdx_file.write_bytes(b"---\r\ntitle: Windows\r\n---\r\n\r\n"
+                         b"import { Chart } from './chart'\r\n\r\n<Chart kind=\"bar\">\r\n  inner\r\n</Chart>\r\n")
+    result = mdx_processor.process_file(str(mdx_file))
+    assert result["frontmatter"] == {"title": "Windows"}
+    assert result["imports"] == [{"items": "Chart ", "source": "./chart"}]
+    assert "\r" not in result["components"][0]["content"]
+
+@pytest.mark.parametrize("frontmatter", [
+    "title: Example MDX\nauthor: LibLearner Team\ndate: 2024-01-01\nlayout: BlogPost",
+    "title: It's a (small) test, really\norder: 3\ncount: -12",
+    "title: Spaced   \n\nauthor: Someone",
+])
+def test_flat_frontmatter_matches_yaml(mdx_processor, frontmatter):
+    """Test the flat frontmatter fast path agrees with yaml.safe_load."""
+    import yaml
+    parsed = mdx_processor._parse_flat_frontmatter(frontmatter)
+    assert parsed is not None
+    assert parsed == yaml.safe_load(frontmatter)
+
+@pytest.mark.parametrize("frontmatter", [
+    "draft: true",
+    "title: \"Quoted\"",
+    "tags: [a, b]",
+    "meta:\n  nested: value",
+    "ratio: 1.5",
+    "note: value # comment",
+    "empty:",
+])
+def test_flat_frontmatter_falls_back(mdx_processor, frontmatter):
+    """Test values YAML could resolve differently are left to yaml.safe_load."""
+    assert mdx_processor._parse_flat_frontmatter(frontmatter) is None
+
+def test_unchanged_file_is_served_from_cache(mdx_processor, create_temp_mdx):
+    """Test unchanged files reuse their result and changed files are reparsed."""
+    mdx_file = create_temp_mdx("---\ntitle: Cached\n---\n")
+    first = mdx_processor.process_file(str(mdx_file))
+    hit = mdx_processor.process_file(str(mdx_file))
+    # Hits are copies, so changing one result leaves later hits intact
+    assert hit == first and hit is not first
+    hit["frontmatter"]["title"] = "Mutated"
+    assert mdx_processor.process_file(str(mdx_file))["frontmatter"] == {"title": "Cached"}
+    assert list(mdx_processor.results_df["content"]) == ["Cached"]
+    
+    mdx_file.write_text("---\ntitle: Changed again\n---\n")
+    second = mdx_processor.process_file(str(mdx_file))
+    assert second is not first
+    assert second["frontmatter"] == {"title": "Changed again"}
+    assert list(mdx_processor.results_df["content"]) == ["Changed again"]
+
+def test_cached_rows_are_not_shared_with_results(mdx_processor, create_temp_mdx):
+    """Test changing a returned result or results_df leaves the cached rows intact."""
+    mdx_file = create_temp_mdx('<Link href="/a">go</Link>\n')
+    first = mdx_processor.process_file(str(mdx_file))
+    first["components"][0]["props"]["href"] = "MUTATED"
+    mdx_processor.results_df["props"][0]["href"] = "MUTATED"
+    mdx_processor.process_file(str(mdx_file))
+    assert list(mdx_processor.results_df["props"]) == [{"href": "/a"}]
+    mdx_processor.results_df["props"][0]["href"] = "MUTATED"
+    hit = mdx_processor.process_file(str(mdx_file))
+    assert hit["components"][0]["props"] == {"href": "/a"}
+    assert list(mdx_processor.results_df["props"]) == [{"href": "/a"}]
+
+@pytest.mark.parametrize("content", [
+    '<Card title="t" n={3}>inner</Card>\n<Button variant="x" />',
+    '<Card a="1">x</Card> note="open <Button b="2">y</Button>',
+    '<Card a={1>x</Card><Button b="2" c={3}>y</Button>',
+    '<Card_x="1" y={2}>inner</Card><Button\u00e9="3">y</Button>',
+])
+def test_component_props_match_per_component_scan(mdx_processor, content):
+    """Test the single props scan agrees with scanning each component alone."""
+    from liblearner.processors.mdx_processor import _iter_components
+    spans = [props_span for _, props_span, _ in _iter_components(content)]
+    expected = [mdx_processor._extract_props(content[start:end]) for start, end in spans]
+    assert mdx_processor._extract_component_props(content, spans) == expected
+
+def test_extract_props_matches_whole_words(mdx_processor):
+    """Test prop names are whole words, whatever precedes them."""
+    props = mdx_processor._extract_props('_a="1" ab-c="2" 1=x é={3} d={} e=""f={4}')
+    assert props == {'_a': '1', 'c': '2', 'é': '3', 'f': '4'}
+    # A long word without a value is scanned in linear time
+    assert mdx_processor._extract_props('x' * 100000 + ' a="y"') == {'a': 'y'}
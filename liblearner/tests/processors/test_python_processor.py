@@ -0,0 +1,217 @@
+import json
+import pytest
+from pathlib import Path
+from liblearner.processors.python_processor import PythonProcessor
+from liblearner.processing_result import PythonProcessingResult
+
+@pytest.fixture
+def python_processor():
+    return PythonProcessor(debug=True)
+
+@pytest.fixture
+def create_temp_py(tmp_path):
+    def _create_temp_py(content: str) -> Path:
+        py_file = tmp_path / "module.py"
+        py_file.write_text(content)
+        return py_file
+    return _create_temp_py
+
+SAMPLE_SOURCE = '''import os
+from typing import List
+
+VERSION = "1.0"
+
+def helper(a, b):
+    """Add two numbers."""
+    return a + b
+
+class Widget(Base):
+    """A widget."""
+    size = 3
+
+    def render(self, scale):
+        def inner():
+            return scale
+        return inner()
+'''
+
+def test_process_file(python_processor, create_temp_py):
+    """Test functions, classes and rows are extracted from a module."""
+    result = python_processor.process_file(str(create_temp_py(SAMPLE_SOURCE)))
+    assert isinstance(result, PythonProcessingResult)
+    assert not result.errors
+    assert [func['name'] for func in result.functions] == ['helper', 'render', 'inner']
+    assert [cls['name'] for cls in result.classes] == ['Widget']
+    
+    df = python_processor.results_df
+    assert list(df.columns) == ['filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type']
+    assert list(df['processor_type']) == ['import', 'import_from', 'declaration', 'function',
+                                          'class', 'method', 'method']
+
+def test_props_are_json(python_processor, create_temp_py):
+    """Test props are JSON that round-trips to the extracted details."""
+    python_processor.process_file(str(create_temp_py(SAMPLE_SOURCE)))
+    df = python_processor.results_df
+    props = {name: json.loads(value) for name, value in zip(df['name'], df['props'])}
+    assert props['os'] == {'asname': None}
+    assert props['typing.List'] == {'asname': None, 'module': 'typing'}
+    assert props['VERSION'] == {}
+    assert props['helper'] == {'args': ['a', 'b'], 'returns': None}
+    assert props['Widget'] == {'bases': ['Base']}
+
+def test_args_include_positional_and_keyword_only(python_processor, create_temp_py):
+    """Test every named parameter is listed in signature order."""
+    result = python_processor.process_file(str(create_temp_py("def f(a, /, b, *args, c, **kwargs):\n    pass\n")))
+    assert result.functions[0]['args'] == ['a', 'b', 'c']
+
+def test_results_are_cached_on_disk(create_temp_py, tmp_path, monkeypatch):
+    """Test an unchanged file is served from the cache without parsing."""
+    cache_dir = tmp_path / "cache"
+    py_file = create_temp_py(SAMPLE_SOURCE)
+    first = PythonProcessor(cache_dir=str(cache_dir)).process_file(str(py_file))
+    assert list(cache_dir.glob("*.pkl"))
+    
+    def fail_process(*args, **kwargs):
+        raise AssertionError("cached file was processed again")
+    monkeypatch.setattr(PythonProcessor, "_process_node", fail_process)
+    processor = PythonProcessor(cache_dir=str(cache_dir))
+    second = processor.process_file(str(py_file))
+    assert second.functions == first.functions
+    assert second.classes == first.classes
+    assert len(processor.results_df) == 7
+    
+    # Any edit misses the cache
+    monkeypatch.undo()
+    py_file.write_text(SAMPLE_SOURCE + "\ndef extra():\n    pass\n")
+    third = PythonProcessor(cache_dir=str(cache_dir)).process_file(str(py_file))
+    assert [func['name'] for func in third.functions][-1] == 'extra'
+
+def test_unchanged_file_is_served_from_memory(python_processor, create_temp_py, monkeypatch):
+    """Test an unchanged file reuses its result and rows without being read again."""
+    py_file = create_temp_py(SAMPLE_SOURCE)
+    first = python_processor.process_file(str(py_file))
+    
+    def fail_read(*args, **kwargs):
+        raise AssertionError("unchanged file was read again")
+    monkeypatch.setattr(Path, "read_bytes", fail_read)
+    hit = python_processor.process_file(str(py_file))
+    assert hit == first and hit is not first
+    assert len(python_processor.results_df) == 14
+    
+    # Hits are copies, so changing one result leaves later hits intact
+    hit.functions.clear()
+    assert python_processor.process_file(str(py_file)).functions == first.functions
+    
+    monkeypatch.undo()
+    py_file.write_text(SAMPLE_SOURCE + "\ndef extra():\n    pass\n")
+    second = python_processor.process_file(str(py_file))
+    assert [func['name'] for func in second.functions][-1] == 'extra'
+
+def test_content_is_sliced_from_source(python_processor, create_temp_py):
+    """Test content is the original source text, decorators and non-ASCII included."""
+    source = 'x = "é"  # comment\n\n@decorator\ndef f(a):\n    return "ü"\n'
+    result = python_processor.process_file(str(create_temp_py(source)))
+    assert result.functions[0]['content'] == '@decorator\ndef f(a):\n    return "ü"'
+    df = python_processor.results_df
+    assert df[df['processor_type'] == 'declaration']['content'].tolist() == ['x = "é"']
+
+def test_docstrings_match_ast_get_docstring(python_processor, create_temp_py):
+    """Test docstrings are cleaned exactly as ast.get_docstring cleans them."""
+    import ast
+    source = ('def one():\n    """  Single\tline.  """\n\n'
+              'def many():\n    """First.\n\n        Indented.\n    """\n\n'
+              'def none():\n    b"bytes"\n')
+    result = python_processor.process_file(str(create_temp_py(source)))
+    expected = [ast.get_docstring(node) or '' for node in ast.parse(source).body]
+    assert [func['docstring'] for func in result.functions] == expected
+
+def test_crlf_and_bom_sources_match_plain_source(python_processor, tmp_path):
+    """Test BOMs and Windows line endings don't shift the sliced content."""
+    source = 'import os\n\ndef f(a):\n    return "ü"\n'
+    plain = tmp_path / "plain.py"
+    plain.write_bytes(source.encode('utf-8'))
+    windows = tmp_path / "windows.py"
+    windows.write_bytes(b'\xef\xbb\xbf' + source.replace('\n', '\r\n').encode('utf-8'))
+    
+    expected = python_processor.process_file(str(plain))
+    result = python_processor.process_file(str(windows))
+    assert not result.errors
+    assert result.functions[0]['content'] == expected.functions[0]['content'] == 'def f(a):\n    return "ü"'
+
+def test_results_are_flushed_in_batches(python_processor, tmp_path):
+    """Test combined results are built once on flush rather than per file."""
+    for idx in range(3):
+        py_file = tmp_path / f"module{idx}.py"
+        py_file.write_text(f"def func{idx}():\n    pass\n")
+        python_processor.process_file(str(py_file))
+    
+    # Nothing is built until the results are requested
+    assert python_processor._results_df.empty
+    df = python_processor.flush()
+    assert list(df['name']) == ['func0', 'func1', 'func2']
+    assert python_processor.results_df is df
+
+def test_process_files_matches_process_file(tmp_path):
+    """Test batch processing gives the same results, in order, as one file at a time."""
+    paths = []
+    for idx in range(5):
+        py_file = tmp_path / f"module{idx}.py"
+        py_file.write_text(f"import os\n\ndef func{idx}(a):\n    return a\n")
+        paths.append(str(py_file))
+    paths.append(str(tmp_path / "missing.py"))
+    
+    single = PythonProcessor()
+    expected = [single.process_file(path) for path in paths]
+    batch = PythonProcessor()
+    results = batch.process_files(paths, max_workers=4)
+    
+    assert [r.functions for r in results] == [r.functions for r in expected]
+    assert [r.errors for r in results] == [r.errors for r in expected]
+    assert results[-1].errors
+    assert batch.results_df.equals(single.results_df)
+
+def test_process_files_reads_a_bounded_window_ahead(tmp_path, monkeypatch):
+    """Test reads stay a few files ahead of parsing and unchanged files aren't read."""
+    import liblearner.processors.python_processor as module
+    paths = []
+    for idx in range(10):
+        py_file = tmp_path / f"module{idx}.py"
+        py_file.write_text(f"def func{idx}():\n    pass\n")
+        paths.append(str(py_file))
+    
+    reads = []
+    read_source = module._read_source
+    monkeypatch.setattr(module, "_read_source", lambda path, *args: reads.append(path) or read_source(path, *args))
+    ahead = []
+    process_source = PythonProcessor._process_source
+    def record_process_source(self, file_path, *args):
+        ahead.append(len(reads) - paths.index(file_path))
+        return process_source(self, file_path, *args)
+    monkeypatch.setattr(PythonProcessor, "_process_source", record_process_source)
+    
+    processor = PythonProcessor()
+    first = processor.process_files(paths, max_workers=1)
+    assert max(ahead) <= 2
+    assert sorted(reads) == sorted(paths)
+    
+    reads.clear()
+    second = processor.process_files(paths, max_workers=1)
+    assert not reads
+    assert [r.functions for r in second] == [r.functions for r in first]
+    assert list(processor.results_df['name']) == [f"func{idx}" for idx in range(10)] * 2
+
+def test_process_files_in_worker_processes(tmp_path):
+    """Test parsing in worker processes gives the same results as in-process."""
+    paths = []
+    for idx in range(5):
+        py_file = tmp_path / f"module{idx}.py"
+        py_file.write_text(f"class Cls{idx}:\n    def method(self):\n        pass\n")
+        paths.append(str(py_file))
+    
+    threaded = PythonProcessor()
+    expected = threaded.process_files(paths)
+    pooled = PythonProcessor()
+    results = pooled.process_files(paths, max_workers=2, use_processes=True)
+    
+    assert [r.classes for r in results] == [r.classes for r in expected]
+    assert pooled.results_df.equals(threaded.results_df)
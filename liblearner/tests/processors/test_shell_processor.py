@@ -0,0 +1,160 @@
+import json
+import pandas as pd
+import pytest
+from pathlib import Path
+from liblearner.processors.shell_processor import ShellProcessor
+from liblearner.processing_result import ShellProcessingResult
+
+@pytest.fixture
+def shell_processor():
+    return ShellProcessor(debug=True)
+
+@pytest.fixture
+def create_temp_sh(tmp_path):
+    def _create_temp_sh(content: str) -> Path:
+        sh_file = tmp_path / "script.sh"
+        sh_file.write_text(content)
+        return sh_file
+    return _create_temp_sh
+
+SAMPLE_SCRIPT = '''#!/bin/bash
+set -e
+
+# Greet someone
+# by name
+function greet() {
+    echo "Hello }" '{'
+    if true; then { echo "$1"; }; fi
+}
+
+NAME="world"
+alias ll='ls -l'
+source ./lib.sh
+'''
+
+def test_process_file(shell_processor, create_temp_sh):
+    """Test functions, variables, aliases and sources are extracted."""
+    result = shell_processor.process_file(str(create_temp_sh(SAMPLE_SCRIPT)))
+    assert isinstance(result, ShellProcessingResult)
+    assert not result.errors
+    assert [func['name'] for func in result.functions] == ['greet']
+    assert result.functions[0]['content'].endswith('fi\n}')
+    assert [var['name'] for var in result.variables] == ['NAME']
+    assert [alias['name'] for alias in result.aliases] == ['ll']
+    assert [source['name'] for source in result.sources] == ['./lib.sh']
+    
+    df = shell_processor.results_df
+    assert list(df.columns) == ['filepath', 'parent_path', 'order', 'name', 'content', 'props', 'processor_type']
+    assert list(df['processor_type']) == ['function', 'variable', 'alias', 'source']
+    # The parent path is only a results column
+    assert list(df['parent_path']) == ['', '', '', '']
+    assert 'parent_path' not in result.functions[0]
+
+def test_props_are_json(shell_processor, create_temp_sh):
+    """Test props are JSON that round-trips to the extracted details."""
+    shell_processor.process_file(str(create_temp_sh(SAMPLE_SCRIPT)))
+    df = shell_processor.results_df
+    props = {name: json.loads(value) for name, value in zip(df['name'], df['props'])}
+    assert props['greet'] == {'doc': 'Greet someone\nby name'}
+    assert props['NAME'] == {'value': '"world"'}
+    assert props['ll'] == {'value': "'ls -l'"}
+    assert props['./lib.sh'] == {}
+
+def test_line_matching_several_element_types(shell_processor, create_temp_sh):
+    """Test one line can be several elements, and spanning matches hide later ones."""
+    script = "source () {\n    echo\n}\nalias a\nalias b=c\n"
+    result = shell_processor.process_file(str(create_temp_sh(script)))
+    assert [func['name'] for func in result.functions] == ['source']
+    assert [source['name'] for source in result.sources] == ['()']
+    # The first alias match runs on to the next line's '='
+    assert [alias['name'] for alias in result.aliases] == ['a\nalias b']
+
+def test_unchanged_file_is_served_from_cache(shell_processor, create_temp_sh):
+    """Test unchanged files reuse their result and changed files are reprocessed."""
+    sh_file = create_temp_sh("FOO=1\n")
+    first = shell_processor.process_file(str(sh_file))
+    hit = shell_processor.process_file(str(sh_file))
+    assert hit == first and hit is not first
+    assert list(shell_processor.results_df['name']) == ['FOO', 'FOO']
+    
+    # Hits are copies, so changing one result leaves later hits intact
+    hit.variables[0]['name'] = 'CHANGED'
+    assert shell_processor.process_file(str(sh_file)).variables == first.variables
+    
+    sh_file.write_text("BAR=22\n")
+    second = shell_processor.process_file(str(sh_file))
+    assert second is not first
+    assert [var['name'] for var in second.variables] == ['BAR']
+
+def test_cache_keeps_a_bounded_number_of_files(shell_processor, tmp_path):
+    """Test the least recently used files are evicted once the cache is full."""
+    shell_processor._cache.maxsize = 2
+    paths = []
+    for idx in range(3):
+        sh_file = tmp_path / f"script{idx}.sh"
+        sh_file.write_text(f"VAR{idx}=1\n")
+        paths.append(str(sh_file))
+        shell_processor.process_file(paths[-1])
+    assert len(shell_processor._cache) == 2
+    assert shell_processor._cache.get(paths[0], None) is None
+
+def test_process_files_in_worker_processes(shell_processor, tmp_path):
+    """Test batch processing in workers matches processing one file at a time."""
+    paths = []
+    for idx in range(4):
+        sh_file = tmp_path / f"script{idx}.sh"
+        sh_file.write_text(f"VAR{idx}=1\nrun{idx}() {{\n    echo {idx}\n}}\n")
+        paths.append(str(sh_file))
+    
+    single = ShellProcessor()
+    expected = [single.process_file(path) for path in paths]
+    results = shell_processor.process_files(paths, max_workers=2)
+    
+    assert [r.functions for r in results] == [r.functions for r in expected]
+    assert shell_processor.results_df.equals(single.results_df)
+
+def test_results_are_flushed_in_batches(shell_processor, tmp_path):
+    """Test combined results are built once on flush rather than per file."""
+    for idx in range(3):
+        sh_file = tmp_path / f"script{idx}.sh"
+        sh_file.write_text(f"VAR{idx}=1\n")
+        shell_processor.process_file(str(sh_file))
+    
+    # Nothing is built until the results are requested
+    assert shell_processor._results_df.empty
+    df = shell_processor.flush()
+    assert list(df['name']) == ['VAR0', 'VAR1', 'VAR2']
+    assert shell_processor.results_df is df
+
+@pytest.mark.parametrize("content", [
+    "a=1\nf() { x; }\nalias ll='ls -l'\n. ./env.sh\nsource lib.sh\n",
+    "function g ( ) {\n}\n b=2\n\x0bc=3\nalias x\n.\x1c./a\ndone=\n",
+    "v=café\nh() { echo é; }\n",
+])
+def test_hyperscan_prefilter_matches_regex_scan(content, monkeypatch):
+    """Test the optional Hyperscan line-start scan finds the same elements as re alone."""
+    from liblearner.processors import shell_processor as module
+    def spans(elements):
+        return {t: [m.span(t) for m in matches] for t, matches in elements.items()}
+    scanned = spans(module._scan_elements(content))
+    monkeypatch.setattr(module, '_get_hs_database', lambda: None)
+    assert scanned == spans(module._scan_elements(content))
+
+def test_large_script_is_read_like_read_text(shell_processor, tmp_path):
+    """Test scripts read through a memory map decode and normalize newlines as read_text does."""
+    from liblearner.processors.shell_processor import _MMAP_THRESHOLD, _read_script
+    sh_file = tmp_path / "large.sh"
+    sh_file.write_bytes(b'VAR=\xc3\xa9\r\nOTHER=2\r' * (_MMAP_THRESHOLD // 8))
+    assert _read_script(sh_file, sh_file.stat().st_size) == sh_file.read_text()
+    
+    result = shell_processor.process_file(str(sh_file))
+    assert result.variables[0]['content'] == 'VAR=é'
+
+def test_results_columns_stay_object_across_flushes(shell_processor, create_temp_sh):
+    """Test text columns stay plain strings, not categoricals, through concat and groupby."""
+    for content in ("A=1\n", "B=2\nC=3\n"):
+        shell_processor.process_file(str(create_temp_sh(content)))
+        df = shell_processor.flush()
+    assert pd.api.types.is_string_dtype(df['parent_path'])
+    assert list(df['parent_path']) == ['', '', '']
+    assert df.groupby('processor_type').size().to_dict() == {'variable': 3}
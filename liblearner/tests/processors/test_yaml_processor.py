@@ -1,5 +1,6 @@
 """Tests for the YAML processor."""
 
+import json
 import os
 from pathlib import Path
 import pytest
@@ -124,9 +125,9 @@ def test_env_vars_extraction():
     df = processor.results_df
     database_rows = df[df['parent_path'].str.contains('database', na=False)]
     
-    # Convert string props to eval-able form and check env vars
+    # Props are JSON; check env vars
     for _, row in database_rows.iterrows():
-        props = eval(row['props'])
+        props = json.loads(row['props'])
         if 'env_vars' in props:
             env_vars = props['env_vars']
             if row['name'] == 'host':
@@ -145,12 +146,231 @@ def test_url_extraction():
     df = processor.results_df
     endpoint_rows = df[df['parent_path'].str.contains('endpoints', na=False)]
     
-    # Convert string props to eval-able form and check URLs
+    # Props are JSON; check URLs
     for _, row in endpoint_rows.iterrows():
-        props = eval(row['props'])
+        props = json.loads(row['props'])
         if 'urls' in props:
             urls = props['urls']
             if row['name'] == 'api':
                 assert 'https://api.example.com/v1' in urls
             elif row['name'] == 'docs':
                 assert 'http://docs.example.com' in urls
+
+def test_nested_entries_summarize_their_subtree(tmp_path):
+    """Test every entry reports the env vars and URLs found anywhere below it."""
+    yaml_file = tmp_path / 'nested.yaml'
+    yaml_file.write_text(
+        "app:\n"
+        "  db: &db\n"
+        "    url: postgres://${DB_HOST}/x\n"
+        "    user: $DB_USER\n"
+        "  copy: *db\n"
+        "  links:\n"
+        "    - https://a.example.com\n"
+        "    - [plain, \"${TOKEN:-none}\"]\n"
+    )
+    processor = YAMLProcessor()
+    processor.process_file(str(yaml_file))
+    df = processor.results_df.set_index('name')
+    
+    app = json.loads(df.loc['app', 'props'])
+    assert set(app['env_vars']) == {'DB_HOST', 'DB_USER', 'TOKEN'}
+    assert set(app['urls']) == {'https://a.example.com'}
+    # The alias reports the same values as the anchored mapping
+    assert set(json.loads(df.loc['copy', 'props'])['env_vars']) == {'DB_HOST', 'DB_USER'}
+    assert set(json.loads(df.loc['links', 'props'])['env_vars']) == {'TOKEN'}
+    doc = json.loads(df.loc['document_0', 'props'])
+    assert doc['structure']['keys']['app']['keys']['links']['items'][1] == {
+        'type': 'sequence', 'items': [{'type': 'str'}, {'type': 'str'}]}
+
+def test_summarize_handles_deep_and_recursive_nodes():
+    """Test node summaries need no recursion and reject recursive aliases."""
+    processor = YAMLProcessor()
+    deep = leaf = {}
+    for _ in range(5000):
+        leaf['child'] = leaf = {}
+    leaf['url'] = 'see https://deep.example.com'
+    env_vars, urls, _ = processor._summarize([deep], {})
+    assert urls == {'https://deep.example.com'}
+    
+    looped = {'name': '$NAME'}
+    looped['self'] = looped
+    with pytest.raises(ValueError):
+        processor._summarize(looped, {})
+
+def test_process_files_in_worker_processes(tmp_path):
+    """Test batch processing in workers matches processing one file at a time."""
+    paths = []
+    for idx in range(3):
+        yaml_file = tmp_path / f'config{idx}.yaml'
+        yaml_file.write_text(f"name: app{idx}\nurl: https://{idx}.example.com\n---\n- $VAR{idx}\n")
+        paths.append(str(yaml_file))
+    
+    single = YAMLProcessor()
+    expected = [single.process_file(path) for path in paths]
+    processor = YAMLProcessor()
+    results = processor.process_files(paths, max_workers=2)
+    
+    assert [r.data for r in results] == [r.data for r in expected]
+    # env_vars and urls are listed in set order, which varies between processes
+    assert processor.results_df.drop(columns='props').equals(single.results_df.drop(columns='props'))
+
+def test_identical_shapes_share_one_structure():
+    """Test repeated shapes reuse a structure, while differently typed keys don't."""
+    processor = YAMLProcessor()
+    items = [{'name': f'svc{idx}', 'ports': [idx]} for idx in range(3)]
+    _, _, structure = processor._summarize({'items': items}, {})
+    first, *rest = structure['keys']['items']['items']
+    assert all(item is first for item in rest)
+    assert first == {'type': 'mapping', 'keys': {'name': {'type': 'str'},
+                                                 'ports': {'type': 'sequence', 'items': [{'type': 'int'}]}}}
+    _, _, mixed = processor._summarize([{1: 'x'}, {True: 'x'}], {})
+    assert str(mixed['items'][0]) != str(mixed['items'][1])
+
+def test_props_are_json(tmp_path):
+    """Test props are JSON, including mapping keys JSON has no type for."""
+    yaml_file = tmp_path / 'dated.yaml'
+    yaml_file.write_text("releases:\n  2024-01-01: ${TAG}\n  2: two\n")
+    processor = YAMLProcessor()
+    processor.process_file(str(yaml_file))
+    df = processor.results_df.set_index('order')
+    
+    releases = json.loads(df.loc[2, 'props'])
+    assert releases == {'key': 'releases', 'value_type': 'dict', 'env_vars': ['TAG'], 'urls': []}
+    assert json.loads(df.loc[3, 'props'])['key'] == '2024-01-01'
+    structure = json.loads(df.loc[1, 'props'])['structure']
+    assert structure['keys']['releases']['keys'] == {'2024-01-01': {'type': 'str'}, '2': {'type': 'str'}}
+
+def test_libyaml_is_used_when_available():
+    """Test the C loader is picked whenever PyYAML was built with libyaml."""
+    import yaml
+    from liblearner.processors.yaml_processor import _SafeLoader
+    if yaml.__with_libyaml__:
+        assert _SafeLoader is yaml.CSafeLoader
+    else:
+        assert _SafeLoader is yaml.SafeLoader
+
+def test_content_is_sliced_from_source(tmp_path):
+    """Test row content is each node's own source text, trailing comments left out."""
+    processor = YAMLProcessor()
+    yaml_file = tmp_path / "source.yaml"
+    yaml_file.write_text("""base: &base
+  host: db  # inline
+  port: 5432
+
+# Services
+app:
+  <<: *base
+  env: [a, "b c"]
+  script: |
+    run
+    # still the script
+  copy: *base
+deps:
+- numpy
+- {name: pandas}
+""", encoding='utf-8-sig')
+    result = processor.process_file(str(yaml_file))
+    assert not result.errors
+    df = processor.results_df
+    content = dict(zip(df['parent_path'] + '/' + df['name'].astype(str), df['content']))
+    
+    assert content['document_0/base'] == 'base: &base\n  host: db  # inline\n  port: 5432'
+    assert content['document_0.base/host'] == 'host: db'
+    assert content['document_0/app'].endswith('# still the script\n  copy: *base')
+    assert content['document_0.app/env'] == 'env: [a, "b c"]'
+    assert content['document_0.app/script'] == 'script: |\n    run\n    # still the script'
+    # Merged pairs and aliases keep the source of the nodes they refer to
+    assert content['document_0.app/port'] == 'port: 5432'
+    assert content['document_0.app/copy'] == 'copy: &base\n  host: db  # inline\n  port: 5432'
+    assert content['document_0.deps/item_0'] == 'numpy'
+    assert content['document_0.deps/item_1'] == '{name: pandas}'
+    assert content['/document_0'].startswith('base:') and content['/document_0'].endswith('- {name: pandas}')
+
+def test_crlf_content_matches_lf_content(tmp_path):
+    """Test Windows line endings and blank lines after block scalars stay out of row content."""
+    source = "a:\n  b: 1\n  c: 2\nscript: |\n  echo $FOO\n  curl http://x.y/z\n\n\nd: 3\n"
+    contents = []
+    for name, newline in (("lf.yaml", "\n"), ("crlf.yaml", "\r\n")):
+        yaml_file = tmp_path / name
+        yaml_file.write_bytes(source.replace("\n", newline).encode('utf-8'))
+        processor = YAMLProcessor()
+        assert not processor.process_file(str(yaml_file)).errors
+        df = processor.results_df
+        contents.append(dict(zip(df['name'].astype(str), df['content'])))
+    assert contents[0] == contents[1]
+    assert contents[1]['a'] == 'a:\n  b: 1\n  c: 2'
+    assert contents[1]['script'] == 'script: |\n  echo $FOO\n  curl http://x.y/z'
+
+def test_repeated_content_is_parsed_once(tmp_path):
+    """Test files with the same bytes share one parse, under any path."""
+    from liblearner.processors.yaml_processor import parse_cache_clear, parse_cache_info
+    parse_cache_clear()
+    paths = []
+    for name in ("a.yaml", "b.yaml"):
+        yaml_file = tmp_path / name
+        yaml_file.write_text("url: ${API_URL}\nitems: [1, 2]\n")
+        paths.append(str(yaml_file))
+    
+    processor = YAMLProcessor(use_parse_cache=True)
+    first, second = [processor.process_file(path) for path in paths]
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.currbytes == len("url: ${API_URL}\nitems: [1, 2]\n") * 100
+    assert first.data == second.data
+    
+    df = processor.results_df
+    rows = df.drop(columns=['filepath', 'order'])
+    half = len(df) // 2
+    assert rows.iloc[:half].reset_index(drop=True).equals(rows.iloc[half:].reset_index(drop=True))
+    
+    # Results hold copies, so changing one leaves later hits intact
+    first.data['doc_0']['items'].append(3)
+    third = processor.process_file(paths[0])
+    assert third.data == {'doc_0': {'url': '${API_URL}', 'items': [1, 2]}}
+
+def test_parse_cache_is_bounded_by_bytes(tmp_path, monkeypatch):
+    """Test the parse cache evicts the least recently used files past its memory budget."""
+    from liblearner.processors import yaml_processor as module
+    cache = module._ParseCache(max_bytes=2000)
+    monkeypatch.setattr(module, '_parse_cache', cache)
+    processor = YAMLProcessor(use_parse_cache=True)
+    for idx, text in enumerate(["a: 1\n", "b: 22\n", "c: 333\n", "d: 4444\n"]):
+        yaml_file = tmp_path / f"f{idx}.yaml"
+        yaml_file.write_text(text)
+        processor.process_file(str(yaml_file))
+    info = module.parse_cache_info()
+    assert (info.currsize, info.currbytes) == (2, 1500)
+    
+    # Files over the whole budget are never cached, nor copied
+    big_file = tmp_path / "big.yaml"
+    big_file.write_text("key: " + "x" * 30 + "\n")
+    monkeypatch.setattr(module.copy, 'deepcopy', None)
+    assert processor.process_file(str(big_file)).data == {'doc_0': {'key': 'x' * 30}}
+    assert module.parse_cache_info().currbytes == 1500
+
+def test_parse_cache_is_opt_in(tmp_path):
+    """Test a processor without the parse cache neither reads nor fills it."""
+    from liblearner.processors.yaml_processor import parse_cache_clear, parse_cache_info
+    parse_cache_clear()
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("key: value\n")
+    processor = YAMLProcessor()
+    for _ in range(2):
+        assert processor.process_file(str(yaml_file)).data == {'doc_0': {'key': 'value'}}
+    assert parse_cache_info()[:2] == (0, 0)
+    assert parse_cache_info().currsize == 0
+
+def test_results_are_flushed_in_batches(tmp_path):
+    """Test combined results are built once on flush rather than per file."""
+    processor = YAMLProcessor()
+    for idx in range(3):
+        yaml_file = tmp_path / f"config{idx}.yaml"
+        yaml_file.write_text(f"key{idx}: {idx}\n")
+        processor.process_file(str(yaml_file))
+    
+    # Nothing is built until the results are requested
+    assert processor._results_df.empty
+    df = processor.flush()
+    assert list(df['name']) == ['document_0', 'key0', 'document_0', 'key1', 'document_0', 'key2']
+    assert processor.results_df is df
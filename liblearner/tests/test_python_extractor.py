@@ -0,0 +1,93 @@
+"""Tests for the function-level Python extractor."""
+
+import subprocess
+import sys
+
+import pytest
+import liblearner.python_extractor as python_extractor
+from liblearner.python_extractor import process_file
+
+SOURCE = '''def outer(a, b):
+    """Outer docstring."""
+    def inner():
+        return a
+    return inner
+
+class Greeter:
+    def greet(self, name):
+        return name
+'''
+
+@pytest.fixture
+def py_file(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text(SOURCE)
+    return path
+
+def test_process_file(py_file):
+    """Test functions, nested functions and methods are extracted in order."""
+    functions = process_file(str(py_file))
+    assert [func[3] for func in functions] == ['outer', 'outer.inner', 'Greeter.greet']
+    assert functions[0][4] == ['a', 'b']
+    assert functions[0][5] == 'Outer docstring.'
+
+def test_records_have_named_fields(py_file):
+    """Test records are tuples whose fields can also be read by name."""
+    record = process_file(str(py_file))[2]
+    assert record.name == 'Greeter.greet'
+    assert record.class_ == 'Greeter'
+    assert record.parameters == ['self', 'name']
+    assert tuple(record) == (record.file, 'Greeter', 3, 'Greeter.greet',
+                             ['self', 'name'], 'N/A', record.code)
+
+def test_process_file_uses_cache(py_file, tmp_path, monkeypatch):
+    """Test unchanged files are served from the cache without being processed."""
+    cache_dir = str(tmp_path / "cache")
+    expected = process_file(str(py_file), cache_dir=cache_dir)
+    
+    def fail_visit(*args, **kwargs):
+        raise AssertionError("cached file was processed again")
+    monkeypatch.setattr(python_extractor.PythonExtractor, "visit", fail_visit)
+    assert process_file(str(py_file), cache_dir=cache_dir) == expected
+    # globals_only results are cached separately
+    with pytest.raises(AssertionError):
+        process_file(str(py_file), globals_only=True, cache_dir=cache_dir)
+
+def test_code_is_sliced_from_source():
+    """Test code is each entity's own source, with decorators and comments kept."""
+    source = ('@cache\n'
+              'def área(x):  # non-ASCII name\n'
+              '    return sorted(x, key=lambda v: -v)\n')
+    functions = python_extractor.extract_functions(source, "module.py")
+    assert [func.name for func in functions] == ['área', 'área.lambda_0']
+    assert functions[0].code == source.rstrip('\n')
+    assert functions[1].code == 'lambda v: -v'
+
+def test_source_can_be_assigned_after_construction():
+    """Test source_code assigned after construction is the one code is sliced from."""
+    import ast
+    extractor = python_extractor.PythonExtractor("module.py")
+    extractor.source_code = SOURCE
+    extractor.visit(ast.parse(SOURCE))
+    assert extractor.functions == python_extractor.extract_functions(SOURCE, "module.py")
+    assert extractor.functions[2].code == 'def greet(self, name):\n        return name'
+
+def test_process_directory_reports_progress(tmp_path):
+    """Test directories are walked once, skipping ignored ones, with an exact total."""
+    for folder in ("", "pkg", "pkg/sub", "venv", "pkg/venv_tools"):
+        (tmp_path / folder).mkdir(exist_ok=True)
+        (tmp_path / folder / "mod.py").write_text("def f():\n    pass\n")
+    (tmp_path / "notes.txt").write_text("def g(): pass\n")
+    
+    progress = []
+    results = python_extractor.process_directory(
+        str(tmp_path), progress_callback=lambda done, total, path: progress.append((done, total)))
+    assert sorted(results) == ['.', 'pkg', 'pkg/sub', 'pkg/venv_tools']
+    assert progress == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+def test_import_does_not_load_processors():
+    """Test the extractor imports without the processors and their dependencies."""
+    code = ("import sys, liblearner.python_extractor; "
+            "print(sorted(m for m in ('liblearner.processors', 'pandas', 'magic') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"